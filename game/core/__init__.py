@@ -3,3 +3,10 @@ from .base_state import BaseState
 from .logger import logger
 from .trigger_handler import TriggerHandler
 from .sound_manager import SoundManager
+from .asset_prefetcher import AssetPrefetcher
+from .asset_manager import AssetManager
+from .blit_audit import BlitAudit, AuditedSurface
+from .text_cache import TextCache
+from .renderer_backend import RendererBackend
+from .quality import QualityGovernor, QualityFeature
+from .profiler import Profiler
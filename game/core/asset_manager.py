@@ -0,0 +1,152 @@
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, Optional, Set
+
+import luneth_engine as le
+import pygame
+import pygame.freetype
+
+from .logger import logger
+from .asset_prefetcher import AssetPrefetcher
+from game.utils import SurfaceKind, display_format, resource_path, to_display_format
+
+
+class AssetManager:
+    """Shared, reference-counted images, GIFs, sounds and fonts.
+
+    Assets are addressed by logical key: ``"rocket_image"`` resolves to the
+    ``"rocket_image_path"`` entry of settings.json. Every key is decoded once
+    no matter how many owners ask for it, and is dropped when its last owner
+    releases it.
+
+    Surfaces are converted to display format on load (see ``SurfaceKind``)
+    and converted again by ``reapply_format`` if the display format changes.
+    """
+
+    FONT_EXTS = (".ttf", ".otf")
+
+    def __init__(self, settings: le.SharedSettings, prefetcher: AssetPrefetcher):
+        self.ss = settings
+        self.prefetcher = prefetcher
+        self._assets: Dict[Hashable, Any] = {}
+        self._owners: Dict[Hashable, Set[int]] = {}
+        self._kinds: Dict[Hashable, Optional[str]] = {}
+        self._format = None  # display format the surfaces were converted to
+
+    def path(self, key: str) -> str:
+        relative_path = self.ss.get(f"{key}_path", None)
+        if not relative_path:
+            raise KeyError(f"No '{key}_path' entry in settings.json")
+        return resource_path(relative_path)
+
+    # --- acquire ---
+    def image(self, key: str, owner, kind: str = None) -> pygame.Surface:
+        """``kind`` is a ``SurfaceKind``; by default it's picked from the pixels."""
+        self._kinds.setdefault(key, kind)
+        return self._acquire(
+            key,
+            owner,
+            lambda: to_display_format(self.prefetcher.image(self.path(key)), kind),
+        )
+
+    def gif(self, key: str, owner):
+        """Return ``(frames, durations_ms)``."""
+        return self._acquire(key, owner, lambda: self.prefetcher.gif(self.path(key)))
+
+    def sound(self, key: str, owner):
+        """Return a mixer sound, or ``None`` if the file does not exist."""
+        return self._acquire(key, owner, lambda: self.prefetcher.sound(self.path(key)))
+
+    def font(self, key: str, owner, size: int = 0) -> pygame.freetype.Font:
+        return self._acquire(
+            (key, size), owner, lambda: pygame.freetype.Font(self.path(key), size)
+        )
+
+    def load(self, key: str, owner):
+        """Acquire ``key`` with the loader its file type calls for."""
+        suffix = Path(self.path(key)).suffix.lower()
+        if suffix in AssetPrefetcher.GIF_EXTS:
+            return self.gif(key, owner)
+        if suffix in AssetPrefetcher.SOUND_EXTS:
+            return self.sound(key, owner)
+        if suffix in self.FONT_EXTS:
+            return self.font(key, owner)
+        return self.image(key, owner)
+
+    def _acquire(self, cache_key: Hashable, owner, load):
+        if cache_key not in self._assets:
+            self._assets[cache_key] = load()
+            self._owners[cache_key] = set()
+            self._format = self._format or display_format()
+            logger.debug(f"Asset loaded: {cache_key}")
+        self._owners[cache_key].add(id(owner))
+        return self._assets[cache_key]
+
+    # --- release ---
+    def release(self, cache_key: Hashable, owner):
+        owners = self._owners.get(cache_key)
+        if owners is None:
+            return
+        owners.discard(id(owner))
+        if not owners:
+            del self._owners[cache_key]
+            del self._assets[cache_key]
+            self._kinds.pop(cache_key, None)
+            logger.debug(f"Asset released: {cache_key}")
+
+    def release_all(self, owner):
+        """Release every asset held by ``owner``."""
+        for cache_key in [k for k, o in self._owners.items() if id(owner) in o]:
+            self.release(cache_key, owner)
+
+    # --- display format ---
+    def reapply_format(self) -> bool:
+        """Convert the loaded surfaces again if the display format changed.
+
+        GIF frame lists are updated in place, so holders see the new frames.
+        Plain surfaces are replaced: holders have to acquire them again (see
+        ``BaseState.reacquire_assets``). Returns True if anything changed.
+        """
+        fmt = display_format()
+        if not self._format or fmt == self._format:
+            return False
+        self._format = fmt
+
+        for cache_key, asset in self._assets.items():
+            if isinstance(asset, pygame.Surface):
+                self._assets[cache_key] = to_display_format(
+                    asset, self._kinds.get(cache_key)
+                )
+            elif isinstance(asset, tuple) and isinstance(asset[0], list):
+                frames = asset[0]
+                frames[:] = [
+                    to_display_format(
+                        frame,
+                        SurfaceKind.ALPHA
+                        if frame.get_flags() & pygame.SRCALPHA
+                        else SurfaceKind.OPAQUE,
+                    )
+                    for frame in frames
+                ]
+        logger.debug("Display format changed, assets converted again")
+        return True
+
+    # --- queries ---
+    def is_loaded(self, cache_key: Hashable) -> bool:
+        return cache_key in self._assets
+
+    def is_ready(self, key: str) -> bool:
+        """True if acquiring ``key`` won't block on decoding."""
+        return self.is_loaded(key) or self.prefetcher.is_warm(self.path(key))
+
+    def prefetch(self, keys: Iterable[str]):
+        """Decode ``keys`` in the background unless they are already resident."""
+        self.prefetcher.prefetch(
+            self.path(key) for key in keys if not self.is_loaded(key)
+        )
+
+    def drop_prefetched(self, keys: Iterable[str]):
+        """Forget background decodes of ``keys`` nobody acquired."""
+        self.prefetcher.discard(self.path(key) for key in keys)
+
+    def __len__(self):
+        return len(self._assets)
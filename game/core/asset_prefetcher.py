@@ -0,0 +1,113 @@
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import pygame
+
+from .logger import logger
+from game.utils import read_gif_bytes, read_gif_raw, frames_from_raw
+
+
+class AssetPrefetcher:
+    """Decodes asset files on a worker thread ahead of the states that need them.
+
+    Workers only produce data that is safe to build off the main thread
+    (raw GIF frames, unconverted images, mixer sounds). The main thread picks
+    the result up with ``gif``/``image``/``sound``, waiting for in-flight work
+    or loading synchronously when the path was never prefetched.
+
+    Several workers decode in parallel (PIL releases the GIL while decoding).
+    With ``processes=True`` GIFs go to a process pool instead and only their
+    raw RGBA buffers come back.
+    """
+
+    GIF_EXTS = (".gif",)
+    SOUND_EXTS = (".mp3", ".wav", ".ogg")
+    MAX_WORKERS = 8
+
+    def __init__(self, workers: int = 0, processes: bool = False):
+        self.workers = workers or self.default_workers()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="prefetch"
+        )
+        self._gif_executor = (
+            ProcessPoolExecutor(max_workers=self.workers) if processes else None
+        )
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default_workers(cls) -> int:
+        """One worker per core, leaving one for the main thread."""
+        return max(1, min(cls.MAX_WORKERS, (os.cpu_count() or 1) - 1))
+
+    def prefetch(self, paths: Iterable[str]):
+        """Queue ``paths`` for background decoding (already queued ones are skipped)."""
+        with self._lock:
+            for path in paths:
+                if path not in self._futures:
+                    self._futures[path] = self._submit(path)
+                    logger.debug(f"Prefetching {path}")
+
+    def discard(self, paths: Iterable[str]):
+        """Forget queued or finished work for ``paths``.
+
+        Queued work is cancelled; running work finishes and is thrown away.
+        """
+        with self._lock:
+            for path in paths:
+                future = self._futures.pop(path, None)
+                if future is not None:
+                    future.cancel()
+                    logger.debug(f"Prefetch dropped {path}")
+
+    def is_warm(self, path: str) -> bool:
+        with self._lock:
+            future = self._futures.get(path)
+        return future is not None and future.done()
+
+    # --- main thread accessors ---
+    def gif(self, path: str):
+        """Return ``(frames, durations_ms)`` for a GIF, in display format."""
+        size, frames, durations, has_alpha = self._take(path)
+        return frames_from_raw(size, frames, has_alpha), durations
+
+    def image(self, path: str) -> pygame.Surface:
+        """Return an unconverted image; the caller converts it to display format."""
+        return self._take(path)
+
+    def sound(self, path: str) -> Optional[pygame.mixer.Sound]:
+        """Return a decoded sound, or ``None`` if the file does not exist."""
+        return self._take(path)
+
+    def _take(self, path: str):
+        with self._lock:
+            future = self._futures.pop(path, None)
+        if future is None:
+            return self._load(path)
+        return future.result()
+
+    # --- worker ---
+    def _submit(self, path: str) -> Future:
+        is_gif = Path(path).suffix.lower() in self.GIF_EXTS
+        if is_gif and self._gif_executor is not None:
+            return self._gif_executor.submit(read_gif_bytes, path)
+        return self._executor.submit(self._load, path)
+
+    def _load(self, path: str):
+        suffix = Path(path).suffix.lower()
+        if suffix in self.GIF_EXTS:
+            return read_gif_raw(path)
+        if suffix in self.SOUND_EXTS:
+            # missing sounds fall back to silence in SoundManager
+            return pygame.mixer.Sound(path) if Path(path).exists() else None
+        return pygame.image.load(path)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._gif_executor is not None:
+            self._gif_executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._futures.clear()
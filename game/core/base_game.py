@@ -1,6 +1,7 @@
 from pathlib import Path
 import glob
 import os
+import time
 from datetime import datetime
 from typing import Tuple
 
@@ -14,7 +15,15 @@ import pygame.freetype
 from .logger import logger
 from .trigger_handler import TriggerHandler
 from .sound_manager import SoundManager
-from game.utils import resource_path
+from .asset_prefetcher import AssetPrefetcher
+from .asset_manager import AssetManager
+from .blit_audit import BlitAudit
+from .text_cache import TextCache
+from .renderer_backend import RendererBackend
+from .quality import QualityGovernor
+from .profiler import Profiler
+from game.ui import TextLayout
+from game.utils import set_render_size, to_render_pos, to_render_rel
 
 
 class BaseGame:
@@ -40,6 +49,13 @@ class BaseGame:
         # Sound manager
         self.sound_manager = SoundManager()
 
+        # shared assets + background decoding for upcoming states
+        self.prefetcher = AssetPrefetcher(
+            workers=self.ss.get("decode_workers", 0),
+            processes=self.ss.get("decode_in_processes", False),
+        )
+        self.assets = AssetManager(self.ss, self.prefetcher)
+
         # init pygame
         pygame.init()
         pygame.mixer.init()
@@ -57,6 +73,48 @@ class BaseGame:
         # fps
         self.fps = self.ss.get("fps", 60)
 
+        # optional fixed timestep: states update in sim_dt steps (at most
+        # max_catchup_steps per frame) and draw with an interpolation alpha
+        self.fixed_timestep = self.ss.get("fixed_timestep", False)
+        self.sim_dt = 1.0 / self.ss.get("sim_rate", 60)
+        self.max_catchup_steps = self.ss.get("max_catchup_steps", 5)
+        self.interpolation = 1.0  # fraction of a step since the last update
+        self._accumulator = 0.0
+
+        # steps registered visual features down when frames overrun the budget
+        self.quality = QualityGovernor(
+            budget_ms=self.ss.get("frame_budget_ms", 0) or 1000 / self.fps,
+            enabled=self.ss.get("quality_governor", True),
+        )
+
+        # per-state frame phase timing (admin toggles it with F5)
+        self.profiler = Profiler(enabled=self.ss.get("profile_frames", False))
+
+        # fullscreen draws to an offscreen surface this fraction of the
+        # display size, scaled up once per frame (fill rate on big panels)
+        self.render_scale = min(1.0, max(0.1, self.ss.get("render_scale", 1.0)))
+        self._render_surf = None
+
+        # optional SDL2 Renderer/Texture presentation ("surface" or "renderer")
+        self.renderer_backend = None
+        if self.ss.get("render_backend", "surface") == "renderer":
+            try:
+                self.renderer_backend = RendererBackend(
+                    software=self.ss.get("renderer_software", True)
+                )
+            except Exception as e:
+                logger.warning(f"Renderer backend unavailable, using surfaces: {e}")
+
+        # layout epoch: moves only when the window size or fullscreen mode
+        # changes, states and widgets re-layout when it does
+        self.layout_epoch = 0
+        self._layout_key = None
+
+        # dirty-rect presentation for states with partial_redraw, falls back
+        # to a flip when the changed area passes this fraction of the screen
+        self.dirty_rects = self.ss.get("dirty_rects", False)
+        self.dirty_rect_threshold = self.ss.get("dirty_rect_threshold", 0.5)
+
         # --- Global Inputs with flags from settings.json ---
 
         # Fullscreen toggle (F11)
@@ -85,6 +143,10 @@ class BaseGame:
                 self.quit_game,
             )
 
+        # admin: log blits of surfaces that are not in display format (F4)
+        self.blit_audit = BlitAudit()
+        self.blit_audit.enabled = self.admin and self.ss.get("audit_blits", False)
+
         # Admin state switching (only if admin flag is True)
         if self.admin:
             self.gi.add_action(
@@ -104,14 +166,24 @@ class BaseGame:
                 lambda events: TriggerHandler.trigger_single_key(events, pygame.K_LEFT),
                 self.sm.previous_state,
             )
+            self.gi.add_action(
+                "blit_audit",
+                lambda events: TriggerHandler.trigger_single_key(events, pygame.K_F4),
+                self.blit_audit.toggle,
+            )
+            self.gi.add_action(
+                "profiler",
+                lambda events: TriggerHandler.trigger_single_key(events, pygame.K_F5),
+                self.profiler.toggle,
+            )
             logger.info("Admin mode enabled: Use LEFT/RIGHT arrows to switch states")
 
         # screenshots
         self.screenshots_folder = Path("screenshots")
 
-        # font
-        print(resource_path("assets/fonts/game_font.ttf"))
-        self.font = pygame.freetype.Font(resource_path("assets/fonts/game_font.ttf"))
+        # font, behind a render cache shared by every state
+        self.font = TextCache(self.assets.path("game_font"))
+        self.text_layout = TextLayout(self.font)
 
         # add game to every state
         for s in self.sm.states:
@@ -122,6 +194,39 @@ class BaseGame:
         state.game = self
         self.sm.add(state)
 
+    def likely_next_states(self, state: le.State) -> list:
+        """States the player can reach next: ``next_state`` order plus hints."""
+        states = list(self.states)
+        likely = [s for s in states if s.name in getattr(state, "likely_next", ())]
+        if state in states:
+            following = states[(states.index(state) + 1) % len(states)]
+            if following not in likely:
+                likely.insert(0, following)
+        return likely
+
+    def prefetch_likely_states(self, state: le.State):
+        for s in self.likely_next_states(state):
+            if not getattr(s, "assets_loaded", True):
+                self.assets.prefetch(s.assets)
+
+    def release_idle_states(self, state: le.State):
+        """Unload the assets of every state that is not ``state`` or likely next.
+
+        Their prefetched but never acquired data is dropped too, unless a
+        live state shares the key.
+        """
+        live = [state, *self.likely_next_states(state)]
+        keep = {key for s in live for key in getattr(s, "assets", ())}
+        for s in self.states:
+            if s in live:
+                continue
+            if getattr(s, "assets_loaded", False):
+                s.unload_assets()
+                logger.debug(f"Released assets of [{s.name}]")
+            self.assets.drop_prefetched(
+                key for key in getattr(s, "assets", ()) if key not in keep
+            )
+
     # --- actions ---
     def on_state_change(self, old: le.State, new: le.State):
         logger.debug(f"Switching from [{old.name}] to [{new.name}]")
@@ -130,6 +235,13 @@ class BaseGame:
         self.sound_manager.cleanup()
 
         self.last_state_tm.reset()
+        self.font.log_stats()
+        self.quality.reset_window()
+        self.profiler.log_summary(old.name)
+
+        # free what can't be reached soon, warm up what can
+        self.release_idle_states(new)
+        self.prefetch_likely_states(new)
 
     def quit_game(self):
         self.running = False
@@ -140,6 +252,15 @@ class BaseGame:
             self.wc.set_mode(self.win_state)
         else:
             self.wc.set_mode(WindowStates.FULLSCREEN)
+        if self.renderer_backend:
+            self.renderer_backend.reset()
+        if self.assets.reapply_format():
+            for s in self.states:
+                if getattr(s, "assets_loaded", False):
+                    s.reacquire_assets()
+        self.update_layout_epoch()
+        if self.state:
+            self.state.mark_dirty()
         logger.debug("Fullscreen toggled")
 
     def take_screenshot(self):
@@ -176,11 +297,108 @@ class BaseGame:
         for f in screenshots:
             os.remove(f)
 
+    def update_layout_epoch(self):
+        """Bump ``layout_epoch`` if the window size or fullscreen mode changed."""
+        key = (self.size, self.wc.is_current_fullscreen_mode())
+        if key != self._layout_key:
+            set_render_size(self.size if self.screen is not self.display else None)
+            self._layout_key = key
+            self.layout_epoch += 1
+            logger.debug(f"Layout epoch {self.layout_epoch}: {key}")
+
+    def step_simulation(self, dt: float):
+        """Run as many fixed ``sim_dt`` updates as ``dt`` covers, capped.
+
+        Time past the cap is dropped, so a hitch slows the game down for a
+        frame instead of snowballing into ever more steps.
+        """
+        state = self.state
+        self._accumulator += dt
+        steps = 0
+        while self._accumulator >= self.sim_dt:
+            if steps == self.max_catchup_steps:
+                logger.debug(f"Dropped {self._accumulator:.3f}s of simulation")
+                self._accumulator %= self.sim_dt
+                break
+            state.update(self.screen, self.sim_dt)
+            self._accumulator -= self.sim_dt
+            steps += 1
+            if self.state is not state:
+                # switched states: the new one starts from a clean step
+                self._accumulator = 0.0
+                break
+        self.interpolation = self._accumulator / self.sim_dt
+
+    def present(self):
+        """Show the frame: only the state's dirty rects when possible."""
+        rects = None
+        if getattr(self.state, "partial_redraw", False):
+            rects = self.state.take_dirty_rects()
+
+        screen, display = self.screen, self.display
+        if self.renderer_backend:
+            # the renderer stretches the frame to the window itself
+            self.renderer_backend.present(screen, rects if self.dirty_rects else None)
+            return
+
+        if screen is not display:
+            # one scale of the whole frame up to the window
+            pygame.transform.scale(screen, display.get_size(), display)
+            if rects is not None:
+                sx = display.get_width() / screen.get_width()
+                sy = display.get_height() / screen.get_height()
+                rects = [
+                    pygame.Rect(
+                        int(r.x * sx),
+                        int(r.y * sy),
+                        int(r.w * sx) + 2,
+                        int(r.h * sy) + 2,
+                    )
+                    for r in rects
+                ]
+
+        if not self.dirty_rects or rects is None:
+            pygame.display.flip()
+            return
+
+        w, h = display.get_size()
+        screen_rect = pygame.Rect(0, 0, w, h)
+        rects = [r.clip(screen_rect) for r in rects]
+        dirty_area = sum(r.w * r.h for r in rects)  # overlaps count twice
+        if dirty_area > self.dirty_rect_threshold * w * h:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
     # --- properties ---
     @property
-    def screen(self) -> pygame.Surface:
+    def display(self) -> pygame.Surface:
+        """The window surface itself."""
         return self.wc.get_screen()
 
+    @property
+    def screen(self) -> pygame.Surface:
+        """The surface states draw on: the window, or an offscreen surface."""
+        display = self.wc.get_screen()
+        scaled = self.render_scale < 1.0 and self.wc.is_current_fullscreen_mode()
+        if not scaled and self.renderer_backend is None:
+            return display
+        dw, dh = display.get_size()
+        scale = self.render_scale if scaled else 1.0
+        size = (max(1, int(dw * scale)), max(1, int(dh * scale)))
+        # the renderer backend composes textures under the frame, through its
+        # transparent pixels
+        alpha = pygame.SRCALPHA if self.renderer_backend else 0
+        surf = self._render_surf
+        if (
+            surf is None
+            or surf.get_size() != size
+            or surf.get_flags() & pygame.SRCALPHA != alpha
+        ):
+            surf = pygame.Surface(size, alpha)
+            self._render_surf = surf.convert_alpha() if alpha else surf.convert()
+        return self._render_surf
+
     @property
     def size(self) -> Tuple[int, int]:
         return self.screen.get_size()
@@ -215,34 +433,68 @@ class BaseGame:
         try:
             if self.state:
                 self.state.startup()
+                self.prefetch_likely_states(self.state)
             while self.running and self.state:
                 self.dt = self.clock.tick(self.fps) / 1000.0  # seconds
+                frame_start = time.perf_counter()
+                profiler = self.profiler
+                profiler.start_frame(self.state.name)
 
                 # time managers
                 self.tm.update(self.dt)
                 self.last_state_tm.update(self.dt)
 
+                # window size/mode changes (and the render size mouse maps to)
+                self.update_layout_epoch()
+                profiler.lap("timers")
+
                 # get events
                 events = pygame.event.get()
+                profiler.lap("events")
 
                 # update inputs
                 self.gi.update(events, self.tm.dt)
+                profiler.lap("inputs")
 
                 # event handle
                 for event in events:
-                    if event.type == pygame.QUIT:
+                    if event.type == pygame.QUIT or (
+                        # the renderer backend's own window was closed
+                        event.type == pygame.WINDOWCLOSE
+                        and self.renderer_backend
+                    ):
                         self.running = False
                     else:
+                        # the renderer backend's logical size already maps
+                        # mouse events on its window to frame coordinates
+                        if not self.renderer_backend:
+                            if hasattr(event, "pos"):
+                                event.pos = to_render_pos(event.pos)
+                            if hasattr(event, "rel"):
+                                event.rel = to_render_rel(event.rel)
                         self.state.get_event(event)
+                profiler.lap("get_event")
 
                 # update + draw
-                self.state.update(self.screen, self.tm.dt)
-                self.state.draw(self.screen)
+                if self.fixed_timestep:
+                    self.step_simulation(self.tm.dt)
+                else:
+                    self.state.update(self.screen, self.tm.dt)
+                profiler.lap("update")
+                if self.blit_audit.enabled:
+                    canvas = self.blit_audit.canvas(self.size)
+                    self.state.draw(canvas)
+                    self.screen.blit(canvas, (0, 0))
+                else:
+                    self.state.draw(self.screen)
+                profiler.lap("draw")
 
                 # TODO: sound
 
                 # update display
-                pygame.display.flip()
+                self.present()
+                profiler.lap("present")
+                self.quality.record(time.perf_counter() - frame_start)
 
         except Exception as e:
             logger.exception(f"An unexpected error occurred in the main loop, {e}")
@@ -250,6 +502,7 @@ class BaseGame:
         finally:
             # Cleanup sounds before quitting
             self.sound_manager.cleanup()
+            self.prefetcher.shutdown()
 
             self.ss.save()
             pygame.quit()
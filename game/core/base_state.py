@@ -1,5 +1,8 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import luneth_engine as le
+import pygame
+
+from game.ui import tint
 
 if TYPE_CHECKING:
     from .base_game import BaseGame
@@ -8,6 +11,115 @@ if TYPE_CHECKING:
 class BaseState(le.State):
     game: "BaseGame"  # type hint for IDE's
 
+    # logical asset keys (see AssetManager) acquired by load_assets
+    assets: Tuple[str, ...] = ()
+
+    # states reachable from this one besides StateManager.next_state
+    likely_next: Tuple[str, ...] = ()
+
+    # opt in to dirty-rect presentation: draw still paints the whole frame,
+    # but only the areas given to mark_dirty are sent to the display
+    partial_redraw: bool = False
+
     def __init__(self, name: str, game: Optional["BaseGame"] = None):
         super().__init__(name)
         self.game = game
+        self.assets_loaded = False
+        self._sound_keys: Dict[str, str] = {}  # SoundManager name -> asset key
+        self._layout_epoch: Optional[int] = None
+        self._dirty_rects: List[pygame.Rect] = []
+        self._full_redraw = True
+
+    def load_assets(self):
+        """Load GIFs, images and sounds. Runs once, before the first startup."""
+        pass
+
+    def unload_assets(self):
+        """Release this state's assets; they load again on the next startup."""
+        assets = self.game.assets
+        assets.release_all(self)
+        for name, key in self._sound_keys.items():
+            if not assets.is_loaded(key):
+                self.game.sound_manager.unload_sound(name)
+        self._sound_keys.clear()
+        self.assets_loaded = False
+
+    def reacquire_assets(self):
+        """Pick up the surfaces ``AssetManager.reapply_format`` converted again.
+
+        By default ``load_assets`` runs again (everything is still cached) and
+        the next update lays out, and so rescales, from the new surfaces.
+        """
+        self.load_assets()
+        self.relayout()
+
+    def load_sound(self, name: str, key: str):
+        """Register the ``key`` asset in the SoundManager under ``name``."""
+        sound = self.game.assets.sound(key, self)
+        self.game.sound_manager.load_sound(name, self.game.assets.path(key), sound)
+        self._sound_keys[name] = key
+
+    def warmup(self):
+        """Optional extra preparation after assets load (e.g. pre-rendered text)."""
+        pass
+
+    # --- layout ---
+    def layout_changed(self) -> bool:
+        """True on the first call after startup and after each window resize."""
+        epoch = self.game.layout_epoch
+        if epoch == self._layout_epoch:
+            return False
+        self._layout_epoch = epoch
+        return True
+
+    def relayout(self):
+        """Make the next ``layout_changed()`` true, e.g. after a quality change."""
+        self._layout_epoch = None
+
+    # --- drawing ---
+    def draw_background(
+        self,
+        screen: pygame.Surface,
+        surf: Optional[pygame.Surface],
+        dest=(0, 0),
+        overlay: Optional[Tuple[int, int, int, int]] = None,
+    ):
+        """Draw a full-screen background, then tint it with an RGBA ``overlay``.
+
+        With the renderer backend the background is a texture composed under
+        the frame, and the frame is cleared to the overlay (or transparent).
+        """
+        backend = self.game.renderer_backend
+        if backend and surf is not None:
+            backend.draw(surf, dest, layer="under")
+            screen.fill(overlay or (0, 0, 0, 0))
+            return
+        if surf is not None:
+            screen.blit(surf, dest)
+        if overlay:
+            tint(screen, overlay)
+
+    # --- dirty rects ---
+    def mark_dirty(self, rect=None):
+        """Report a changed screen area; no ``rect`` means the whole screen."""
+        if rect is None:
+            self._full_redraw = True
+        elif not self._full_redraw:
+            self._dirty_rects.append(pygame.Rect(rect))
+
+    def take_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Areas changed since the last call, ``None`` for the whole screen."""
+        rects = None if self._full_redraw else self._dirty_rects
+        self._dirty_rects = []
+        self._full_redraw = False
+        return rects
+
+    def ensure_assets(self):
+        if not self.assets_loaded:
+            self.load_assets()
+            self.assets_loaded = True
+
+    def startup(self):
+        self.ensure_assets()
+        self._layout_epoch = None
+        self.mark_dirty()
@@ -0,0 +1,62 @@
+import sys
+from typing import Set, Tuple
+
+import pygame
+
+from .logger import logger
+from game.utils import is_display_format
+
+
+class AuditedSurface(pygame.Surface):
+    """Draw target that reports every blit of a non display-format source."""
+
+    audit: "BlitAudit"
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        self.audit.check(source)
+        return super().blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=True):
+        blit_sequence = list(blit_sequence)
+        for item in blit_sequence:
+            self.audit.check(item[0])
+        return super().blits(blit_sequence, doreturn)
+
+
+class BlitAudit:
+    """Admin tool: states draw into an audited canvas instead of the screen.
+
+    Each blit whose source needs a pixel conversion is logged once per call
+    site. The canvas costs one extra full-screen blit per frame, so this is
+    only meant for admin runs.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._canvas: AuditedSurface = None
+        self._reported: Set[Tuple[str, int]] = set()
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        logger.info(f"Blit audit {'enabled' if self.enabled else 'disabled'}")
+
+    def canvas(self, size: Tuple[int, int]) -> AuditedSurface:
+        if self._canvas is None or self._canvas.get_size() != size:
+            self._canvas = AuditedSurface(size)
+            self._canvas.audit = self
+        return self._canvas
+
+    def check(self, source: pygame.Surface):
+        if is_display_format(source):
+            return
+
+        # sys._getframe(2): skip check() and AuditedSurface.blit
+        frame = sys._getframe(2)
+        site = (frame.f_code.co_filename, frame.f_lineno)
+        if site in self._reported:
+            return
+        self._reported.add(site)
+        logger.warning(
+            f"Blit of non display-format surface {source.get_size()} "
+            f"{source.get_bitsize()}bpp at {site[0]}:{site[1]}"
+        )
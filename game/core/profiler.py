@@ -0,0 +1,113 @@
+import time
+from collections import deque
+from typing import Deque, Dict
+
+from .logger import logger
+
+
+class _NullZone:
+    """What ``zone`` hands out while profiling is off: does nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_ZONE = _NullZone()
+
+
+class _Zone:
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    """Per-state frame timing: loop phases and named zones, in ring buffers.
+
+    ``BaseGame.run`` calls ``start_frame`` and then ``lap(phase)`` after each
+    phase of the frame. States time their own subsystems with::
+
+        with self.game.profiler.zone("particles"):
+            ...
+
+    While disabled, ``lap`` returns right away and ``zone`` hands out a
+    shared no-op context, so the instrumentation can stay in place.
+    """
+
+    def __init__(self, enabled: bool = False, capacity: int = 600):
+        self.enabled = enabled
+        self.capacity = capacity  # samples kept per state and name
+        self._buffers: Dict[object, Dict[str, Deque[float]]] = {}
+        self._current: Dict[str, Deque[float]] = {}
+        self._last = 0.0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        # turned on mid-frame: lap from now, and keep this partial frame out
+        # of every state's buffers until the next start_frame
+        self._current = {}
+        self._last = time.perf_counter()
+        logger.info(f"Frame profiler {'on' if self.enabled else 'off'}")
+
+    # --- recording ---
+    def start_frame(self, state_name):
+        if not self.enabled:
+            return
+        self._current = self._buffers.setdefault(state_name, {})
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str):
+        """Record the time since the previous lap (or frame start) as ``phase``."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.record(phase, now - self._last)
+        self._last = now
+
+    def zone(self, name: str):
+        if not self.enabled:
+            return _NULL_ZONE
+        return _Zone(self, name)
+
+    def record(self, name: str, seconds: float):
+        samples = self._current.get(name)
+        if samples is None:
+            samples = self._current[name] = deque(maxlen=self.capacity)
+        samples.append(seconds * 1000)
+
+    # --- reporting ---
+    @staticmethod
+    def percentiles(samples) -> tuple:
+        """(p50, p95, p99) of ``samples``."""
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return tuple(ordered[round(last * p)] for p in (0.5, 0.95, 0.99))
+
+    def log_summary(self, state_name):
+        """Log p50/p95/p99 in ms of every phase and zone of a state."""
+        buffers = self._buffers.get(state_name)
+        if not buffers:
+            return
+        lines = [f"Frame timing [{state_name}] (ms, p50 / p95 / p99):"]
+        for name, samples in buffers.items():
+            p50, p95, p99 = self.percentiles(samples)
+            lines.append(
+                f"  {name:<16} {p50:7.2f} {p95:7.2f} {p99:7.2f}"
+                f"  ({len(samples)} samples)"
+            )
+        logger.info("\n".join(lines))
+
+    def clear(self):
+        self._buffers.clear()
+        self._current = {}
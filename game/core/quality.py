@@ -0,0 +1,94 @@
+from collections import deque
+from typing import Callable, Dict, List, Sequence
+
+from .logger import logger
+
+
+class QualityFeature:
+    """A visual feature with one value per quality level (low to high).
+
+    ``value`` always holds the value for the current level, so checking it
+    in a draw call costs an attribute read. ``on_change`` callbacks run when
+    the level moves, for features that have to rebuild something.
+    """
+
+    def __init__(self, name: str, values: Sequence, level: int):
+        self.name = name
+        self.values = tuple(values)
+        self.on_change: List[Callable] = []
+        self.value = self._value_for(level)
+
+    def _value_for(self, level: int):
+        return self.values[min(level, len(self.values) - 1)]
+
+    def set_level(self, level: int):
+        value = self._value_for(level)
+        if value != self.value:
+            self.value = value
+            for callback in self.on_change:
+                callback(value)
+
+
+class QualityGovernor:
+    """Steps quality down when frames run over budget, and back up after.
+
+    Work time of every frame (sleep excluded) goes into a rolling window. Once
+    a window is full its 90th percentile is checked: over ``budget_ms`` drops a
+    level, under ``headroom`` of the budget raises one. The window is cleared
+    after every change, so a level gets a full window before the next move.
+    """
+
+    LOW, MEDIUM, HIGH = 0, 1, 2
+
+    def __init__(
+        self,
+        budget_ms: float,
+        window: int = 60,
+        headroom: float = 0.6,
+        enabled: bool = True,
+    ):
+        self.budget_ms = budget_ms
+        self.headroom = headroom
+        self.enabled = enabled
+        self.level = self.HIGH
+        self.features: Dict[str, QualityFeature] = {}
+        self._frames = deque(maxlen=window)
+
+    def register(
+        self, name: str, values: Sequence, on_change: Callable = None
+    ) -> QualityFeature:
+        """Add a feature with ``values`` for LOW, MEDIUM and HIGH quality."""
+        feature = QualityFeature(name, values, self.level)
+        if on_change:
+            feature.on_change.append(on_change)
+        self.features[name] = feature
+        return feature
+
+    def record(self, frame_seconds: float):
+        if not self.enabled:
+            return
+        frames = self._frames
+        frames.append(frame_seconds * 1000)
+        if len(frames) < frames.maxlen:
+            return
+
+        p90 = sorted(frames)[int(len(frames) * 0.9)]
+        if p90 > self.budget_ms and self.level > self.LOW:
+            self.set_level(self.level - 1, p90)
+        elif p90 < self.budget_ms * self.headroom and self.level < self.HIGH:
+            self.set_level(self.level + 1, p90)
+
+    def reset_window(self):
+        """Forget recorded frames, e.g. after a state switch hitch."""
+        self._frames.clear()
+
+    def set_level(self, level: int, p90: float = None):
+        self.level = max(self.LOW, min(self.HIGH, level))
+        self._frames.clear()
+        for feature in self.features.values():
+            feature.set_level(self.level)
+        if p90 is not None:
+            logger.info(
+                f"Quality level {self.level} (p90 frame {p90:.1f} ms, "
+                f"budget {self.budget_ms:.1f} ms)"
+            )
@@ -0,0 +1,140 @@
+import weakref
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+from .logger import logger
+
+try:
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError:  # pygame built without SDL2 video bindings
+    Renderer = Texture = Window = None
+
+# SDL_BlendMode values
+BLENDMODE_NONE = 0
+BLENDMODE_BLEND = 1
+
+
+class RendererBackend:
+    """Presents frames through an SDL2 ``Renderer`` instead of a display flip.
+
+    States still draw the frame on a surface; it is uploaded to one streaming
+    texture (only the dirty rects when given) and the renderer stretches it to
+    the window. Surfaces that never change can skip the frame altogether:
+    ``draw`` uploads them once as textures and the renderer composes them
+    under the frame (backgrounds, where the frame is left transparent) or
+    over it (sprites nothing is drawn on). The frame surface has per-pixel
+    alpha for this (see ``BaseState.draw_background``). ``software`` picks
+    SDL's software renderer, which works on any machine.
+
+    SDL won't put a renderer on the ``set_mode`` window (it already has a
+    surface), so the backend opens its own window and hides the display one.
+    The display surface stays around for ``convert()`` and sizes.
+    """
+
+    LAYERS = ("under", "over")
+
+    def __init__(self, software: bool = True, vsync: bool = False):
+        if Renderer is None:
+            raise RuntimeError("pygame._sdl2.video is not available")
+        self.software = software
+        self.vsync = vsync
+        self._textures: "weakref.WeakKeyDictionary[pygame.Surface, Texture]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._queues: Dict[str, List[Tuple[Texture, pygame.Rect, int]]] = {
+            layer: [] for layer in self.LAYERS
+        }
+        self._frame: Optional[Texture] = None
+        self._title = pygame.display.get_caption()[0]
+
+        display = pygame.display.get_surface()
+        if display is None:
+            raise RuntimeError("the display mode has to be set first")
+        self.window = Window(self._title, display.get_size())
+        self.renderer = Renderer(
+            self.window, accelerated=0 if self.software else -1, vsync=self.vsync
+        )
+        self.reset()
+        logger.info(
+            f"Renderer backend: {'software' if self.software else 'accelerated'}"
+        )
+
+    def reset(self):
+        """Follow the display window after its mode changed (e.g. fullscreen).
+
+        Textures stay valid: they belong to the renderer, not the mode.
+        """
+        for queue in self._queues.values():
+            queue.clear()
+        Window.from_display_module().hide()  # set_mode shows it again
+
+        display = pygame.display.get_surface()
+        if display.get_flags() & pygame.FULLSCREEN:
+            self.window.set_fullscreen(desktop=True)
+        else:
+            self.window.set_windowed()
+            self.window.size = display.get_size()
+        self.window.show()
+        self.window.focus()
+
+    # --- textures ---
+    def texture(self, surface: pygame.Surface) -> Texture:
+        """Texture of ``surface``, uploaded the first time it is asked for."""
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = Texture.from_surface(self.renderer, surface)
+            self._textures[surface] = texture
+        return texture
+
+    def draw(
+        self, surface: pygame.Surface, dest, shade: int = 255, layer: str = "over"
+    ):
+        """Compose a static ``surface`` with this frame at ``dest``.
+
+        ``layer`` "under" shows it through the transparent pixels of the frame,
+        "over" puts it on top. ``shade`` darkens it (255 leaves it as is).
+        """
+        texture = self.texture(surface)
+        rect = pygame.Rect(dest, surface.get_size())
+        self._queues[layer].append((texture, rect, shade))
+
+    # --- frame ---
+    def present(self, frame: pygame.Surface, rects: Sequence[pygame.Rect] = None):
+        """Upload ``frame`` (all of it, or just ``rects``) and show it."""
+        size = frame.get_size()
+        texture = self._frame
+        if texture is None or texture.get_rect().size != size:
+            texture = self._frame = Texture(self.renderer, size, streaming=True)
+            rects = None  # a new texture needs the whole frame
+        self.renderer.logical_size = size
+
+        # states set the caption on the (hidden) display window
+        title = pygame.display.get_caption()[0]
+        if title != self._title:
+            self.window.title = self._title = title
+
+        if rects is None:
+            texture.update(frame)
+        else:
+            bounds = frame.get_rect()
+            for rect in rects:
+                rect = rect.clip(bounds)
+                if rect.w and rect.h:
+                    texture.update(frame.subsurface(rect), rect)
+
+        under, over = self._queues["under"], self._queues["over"]
+        # blending the frame costs a pass, only pay it when something is below
+        texture.blend_mode = BLENDMODE_BLEND if under else BLENDMODE_NONE
+        self.renderer.clear()
+        self._draw_queue(under)
+        texture.draw()
+        self._draw_queue(over)
+        self.renderer.present()
+
+    @staticmethod
+    def _draw_queue(queue: List[Tuple[Texture, pygame.Rect, int]]):
+        for static, rect, shade in queue:
+            static.color = (shade, shade, shade)
+            static.draw(dstrect=rect)
+        queue.clear()
@@ -22,11 +22,16 @@ class SoundManager:
         self.music_volume: float = 0.7
         self.sound_volume: float = 0.8
 
-    def load_sound(self, name: str, path: str) -> pygame.mixer.Sound:
-        """Load a sound effect."""
+    def load_sound(
+        self, name: str, path: str, sound: Optional[pygame.mixer.Sound] = None
+    ) -> pygame.mixer.Sound:
+        """Load a sound effect (or register an already decoded ``sound``)."""
         if name not in self.sounds:
             sound_path = Path(path)
-            if sound_path.exists():
+            if sound is not None:
+                self.sounds[name] = sound
+                self.sounds[name].set_volume(self.sound_volume)
+            elif sound_path.exists():
                 self.sounds[name] = pygame.mixer.Sound(str(sound_path))
                 self.sounds[name].set_volume(self.sound_volume)
             else:
@@ -35,6 +40,12 @@ class SoundManager:
                 self.sounds[name] = pygame.mixer.Sound(buffer=bytes(100))
         return self.sounds[name]
 
+    def unload_sound(self, name: str):
+        """Forget a sound effect, stopping it first."""
+        self.stop_sound(name)
+        self.channels.pop(name, None)
+        self.sounds.pop(name, None)
+
     def play_sound(
         self,
         name: str,
@@ -0,0 +1,100 @@
+from collections import OrderedDict
+from typing import Hashable, Tuple
+
+import pygame
+import pygame.freetype
+
+from .logger import logger
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text in front of a FreeType font file.
+
+    ``render`` takes the same arguments as ``pygame.freetype.Font.render``
+    and returns ``(surface, rect)``. The rect is a fresh copy, but the surface
+    is shared between callers: copy it before changing it. Every size gets
+    its own ``Font`` object (also LRU bounded), so nothing ever changes a
+    shared ``font.size``.
+    """
+
+    def __init__(
+        self,
+        font_path: str,
+        size: float = 0,
+        max_entries: int = 512,
+        max_fonts: int = 32,
+    ):
+        self.font_path = font_path
+        self.size = size  # used for size=0, like Font.size
+        self.max_entries = max_entries
+        self.max_fonts = max_fonts
+
+        self._renders: "OrderedDict[Hashable, Tuple]" = OrderedDict()
+        self._fonts: "OrderedDict[float, pygame.freetype.Font]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size: float = 0) -> pygame.freetype.Font:
+        """Font object for ``size`` (the default size when 0)."""
+        size = size or self.size
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.freetype.Font(self.font_path, size)
+            self._fonts[size] = font
+            if len(self._fonts) > self.max_fonts:
+                self._fonts.popitem(last=False)
+        else:
+            self._fonts.move_to_end(size)
+        return font
+
+    def render(
+        self,
+        text: str,
+        fgcolor=None,
+        bgcolor=None,
+        style: int = pygame.freetype.STYLE_DEFAULT,
+        rotation: int = 0,
+        size: float = 0,
+    ) -> Tuple[pygame.Surface, pygame.Rect]:
+        size = size or self.size
+        key = (
+            text,
+            tuple(fgcolor) if fgcolor is not None else None,
+            tuple(bgcolor) if bgcolor is not None else None,
+            style,
+            rotation,
+            size,
+        )
+
+        cached = self._renders.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._renders.move_to_end(key)
+        else:
+            self.misses += 1
+            cached = self.font(size).render(text, fgcolor, bgcolor, style, rotation)
+            self._renders[key] = cached
+            if len(self._renders) > self.max_entries:
+                self._renders.popitem(last=False)
+
+        surf, rect = cached
+        return surf, rect.copy()
+
+    # --- stats ---
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def log_stats(self, reset: bool = True):
+        logger.debug(
+            f"Text cache: {self.hit_rate:.1%} hits "
+            f"({self.hits}/{self.hits + self.misses}), "
+            f"{len(self._renders)} renders, {len(self._fonts)} font sizes"
+        )
+        if reset:
+            self.hits = self.misses = 0
+
+    def clear(self):
+        self._renders.clear()
+        self._fonts.clear()
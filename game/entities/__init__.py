@@ -1 +1,2 @@
 from .rocket import Rocket
+from .particles import ParticleSystem, ParticleAtlas, Emitter, PRESETS
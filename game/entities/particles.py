@@ -0,0 +1,265 @@
+import math
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pygame
+
+from game.ui import Colors
+from game.utils import SurfaceKind, to_display_format
+
+
+class Emitter:
+    """Spawn settings for a burst of particles.
+
+    Ranges are ``(low, high)``: speeds in px/sec, lifetimes in seconds and
+    sizes in pixels (inclusive). ``jitter`` offsets the spawn point by up to
+    that many pixels, ``angle`` limits the direction in radians and
+    ``gravity`` pulls particles down in px/sec².
+    """
+
+    def __init__(
+        self,
+        count: int,
+        speed: Tuple[float, float],
+        life: Tuple[float, float],
+        size: Tuple[int, int],
+        colors: Sequence[Tuple[int, int, int]],
+        jitter: int = 0,
+        angle: Tuple[float, float] = (0.0, 2 * math.pi),
+        gravity: float = 0.0,
+    ):
+        self.count = count
+        self.speed = speed
+        self.life = life
+        self.size = size
+        self.colors = tuple(colors)
+        self.jitter = jitter
+        self.angle = angle
+        self.gravity = gravity
+
+
+# presets for the game's effects
+PRESETS: Dict[str, Emitter] = {
+    # LifeSupport: an emergency got fixed
+    "repair": Emitter(
+        count=12,
+        speed=(20, 60),
+        life=(0.5, 1.2),
+        size=(3, 6),
+        colors=(Colors.FROST_WHITE,),
+        jitter=8,
+    ),
+    # SpaceQuiz: correct answer
+    "success": Emitter(
+        count=30,
+        speed=(50, 150),
+        life=(0.5, 1.2),
+        size=(3, 8),
+        colors=(Colors.ELECTRIC_BLUE, Colors.ICE_BLUE, Colors.FROST_WHITE),
+    ),
+    # SpaceQuiz: quiz complete, a big confetti burst
+    "celebration": Emitter(
+        count=2000,
+        speed=(100, 400),
+        life=(1.0, 2.5),
+        size=(2, 6),
+        colors=(
+            Colors.ELECTRIC_BLUE,
+            Colors.ICE_BLUE,
+            Colors.FROST_WHITE,
+            Colors.CREAM,
+        ),
+        angle=(math.pi, 2 * math.pi),  # upwards
+        gravity=250.0,
+    ),
+}
+
+
+class ParticleSystem:
+    """Particles stored as NumPy arrays (struct of arrays).
+
+    Live particles are always the first ``len(self)`` rows, so updates are a
+    handful of vectorized operations and dead ones are dropped by compacting
+    with a mask. Colors are kept as indexes into ``palette``.
+    """
+
+    def __init__(self, capacity: int = 256, fade_time: float = 1.2):
+        self.fade_time = fade_time  # particles fade out over their last seconds
+        self.palette = []
+        self._palette_index: Dict[Tuple[int, int, int], int] = {}
+        self._rng = np.random.default_rng()
+        self._count = 0
+        self._atlas: Optional["ParticleAtlas"] = None  # built on first draw
+        self._allocate(capacity)
+
+    # --- storage ---
+    def _allocate(self, capacity: int):
+        self.pos = np.zeros((capacity, 2), np.float32)
+        self.vel = np.zeros((capacity, 2), np.float32)
+        self.life = np.zeros(capacity, np.float32)
+        self.gravity = np.zeros(capacity, np.float32)
+        self.size = np.zeros(capacity, np.int16)
+        self.color = np.zeros(capacity, np.int16)
+
+    def _arrays(self):
+        return (self.pos, self.vel, self.life, self.gravity, self.size, self.color)
+
+    def _reserve(self, extra: int):
+        needed = self._count + extra
+        capacity = len(self.life)
+        if needed <= capacity:
+            return
+        capacity = max(capacity, 1)  # an empty system can't double from 0
+        while capacity < needed:
+            capacity *= 2
+        old, n = self._arrays(), self._count
+        self._allocate(capacity)
+        for new, arr in zip(self._arrays(), old):
+            new[:n] = arr[:n]
+
+    def _color_index(self, color) -> int:
+        color = tuple(color[:3])
+        index = self._palette_index.get(color)
+        if index is None:
+            index = self._palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return index
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._count = 0
+
+    # --- spawning ---
+    def emit(
+        self,
+        x: float,
+        y: float,
+        emitter: Union[str, Emitter],
+        count: Optional[int] = None,
+        scale: float = 1.0,
+    ):
+        """Spawn a burst at (x, y) from an ``Emitter`` or a preset name.
+
+        ``scale`` multiplies the count, for quality levels.
+        """
+        if isinstance(emitter, str):
+            emitter = PRESETS[emitter]
+        n = round((emitter.count if count is None else count) * scale)
+        if n <= 0:
+            return
+        self._reserve(n)
+        rng = self._rng
+        s = slice(self._count, self._count + n)
+
+        self.pos[s] = (x, y)
+        if emitter.jitter:
+            self.pos[s] += rng.integers(-emitter.jitter, emitter.jitter + 1, (n, 2))
+
+        angle = rng.uniform(*emitter.angle, n)
+        speed = rng.uniform(*emitter.speed, n)
+        self.vel[s, 0] = np.cos(angle) * speed
+        self.vel[s, 1] = np.sin(angle) * speed
+
+        self.life[s] = rng.uniform(*emitter.life, n)
+        self.gravity[s] = emitter.gravity
+        self.size[s] = rng.integers(emitter.size[0], emitter.size[1] + 1, n)
+        colors = [self._color_index(c) for c in emitter.colors]
+        self.color[s] = rng.choice(colors, n)
+
+        self._count += n
+
+    # --- update ---
+    def update(self, dt: float):
+        n = self._count
+        if not n:
+            return
+        vel, life = self.vel[:n], self.life[:n]
+        vel[:, 1] += self.gravity[:n] * dt
+        self.pos[:n] += vel * dt
+        life -= dt
+
+        alive = life > 0
+        kept = int(np.count_nonzero(alive))
+        if kept < n:
+            for arr in self._arrays():
+                arr[:kept] = arr[:n][alive]
+            self._count = kept
+
+    def alphas(self) -> np.ndarray:
+        """Alpha (0-255) of each live particle, fading with remaining life."""
+        life = self.life[: self._count]
+        return np.clip(life * (255 / self.fade_time), 0, 255).astype(np.uint8)
+
+    # --- drawing ---
+    def draw(self, screen: pygame.Surface):
+        """Draw every live particle with a single ``blits`` call."""
+        n = self._count
+        if not n:
+            return
+        sizes = self.size[:n]
+        atlas = self._atlas
+        if atlas is None or not atlas.covers(len(self.palette), int(sizes.max())):
+            atlas = self._atlas = ParticleAtlas(self.palette, max(int(sizes.max()), 8))
+
+        cells = atlas.cells(sizes, self.color[:n], self.alphas())
+        visible = cells >= 0  # fully faded particles are skipped
+        areas = atlas.areas
+        pos = self.pos[:n][visible].astype(np.int32).tolist()
+        screen.blits(
+            [
+                (atlas.surface, xy, areas[cell])
+                for xy, cell in zip(pos, cells[visible].tolist())
+            ],
+            doreturn=False,
+        )
+
+
+class ParticleAtlas:
+    """Every particle sprite pre-rendered once onto one surface.
+
+    One row per (color, size) and one column per quantized alpha level, so a
+    particle is drawn by blitting an ``area`` of the atlas instead of making
+    and filling a surface of its own.
+    """
+
+    ALPHA_LEVELS = 16
+
+    def __init__(self, palette: Sequence[Tuple[int, int, int]], max_size: int):
+        self.colors = len(palette)
+        self.max_size = max_size
+        levels = self.ALPHA_LEVELS
+        cell = max_size
+
+        surface = pygame.Surface(
+            (cell * levels, cell * max_size * self.colors), pygame.SRCALPHA
+        )
+        self.areas = []
+        for color in palette:
+            for size in range(1, max_size + 1):
+                y = len(self.areas) // levels * cell
+                radius = size // 2
+                for level in range(levels):
+                    area = pygame.Rect(level * cell, y, size, size)
+                    alpha = 255 * level // (levels - 1)
+                    pygame.draw.circle(
+                        surface,
+                        (*color, alpha),
+                        (area.x + radius, area.y + radius),
+                        radius,
+                    )
+                    self.areas.append(area)
+        self.surface = to_display_format(surface, SurfaceKind.ALPHA)
+
+    def covers(self, colors: int, max_size: int) -> bool:
+        return colors <= self.colors and max_size <= self.max_size
+
+    def cells(
+        self, sizes: np.ndarray, colors: np.ndarray, alphas: np.ndarray
+    ) -> np.ndarray:
+        """Index into ``areas`` for each particle, -1 where alpha rounds to 0."""
+        levels = self.ALPHA_LEVELS
+        level = (alphas.astype(np.int32) * (levels - 1) + 127) // 255
+        row = colors.astype(np.int32) * self.max_size + sizes - 1
+        return np.where(level > 0, row * levels + level, -1)
@@ -1,8 +1,8 @@
 from typing import Tuple
 import pygame
 import random
-from game.ui import Colors
-from game.utils import resource_path
+from game.ui import Colors, tint
+from game.utils import resource_path, to_display_format, RotationCache, mouse_pos
 
 
 class Rocket:
@@ -13,6 +13,7 @@ class Rocket:
         y_offset_ratio: float = 0.03,
         speed: float = 200.0,
         image_path: str = None,
+        image: pygame.Surface = None,
         shake_strength: int = 1,
         height_reach: int = 0,
         fall: bool = True,
@@ -24,6 +25,8 @@ class Rocket:
         flying_sound=None,
         dying_sound=None,
         falling_sound=None,
+        rotation_steps: int = 90,
+        smooth_rotation: bool = False,
     ):
         self.size_ratio = size_ratio
         self.x_ratio = x_ratio
@@ -45,16 +48,22 @@ class Rocket:
 
         # image
         self.image_path = image_path or "assets/images/rocket.png"
-        self.image_original = pygame.image.load(
-            resource_path(self.image_path)
-        ).convert_alpha()
+        self.image_original = (
+            image
+            if image is not None
+            else to_display_format(pygame.image.load(resource_path(self.image_path)))
+        )
         self.base_image = self.image_original
+        self._scaled = {}  # scaled base image per screen size
+        self.smooth_scale = True  # smoothscale, or the cheaper scale
         self.rocket = self.base_image
         self.rocket_rect = self.rocket.get_rect()
 
         # rotation & physics
         self.angle = 0.0
         self.rotation_speed = 90.0
+        self.rotations = RotationCache(rotation_steps, smooth=smooth_rotation)
+        self.rotations.set_image(self.base_image)
         self.velocity = -self.base_speed
         self.gravity = 350.0
 
@@ -76,6 +85,7 @@ class Rocket:
 
         # original position
         self.original_pos = self.rocket_rect.topleft
+        self._prev_centery = self.rocket_rect.centery  # for draw interpolation
 
     def startup(self):
         self.rocket_rect.topleft = self.original_pos
@@ -104,6 +114,10 @@ class Rocket:
             self.start_flying()
 
     def start_flying(self):
+        # rotate the falling sprites while the rocket is still going up
+        if self.fall:
+            self.rotations.prerender()
+
         self.clicked = True
         self.going_up = True
         self.done = False
@@ -123,10 +137,10 @@ class Rocket:
 
         screen_w, screen_h = screen.get_size()
         self.resize_and_repos(screen_w, screen_h)
+        self._prev_centery = self.rocket_rect.centery
 
         # hover detection
-        mouse_pos = pygame.mouse.get_pos()
-        self.hover = self.rocket_rect.collidepoint(mouse_pos)
+        self.hover = self.rocket_rect.collidepoint(mouse_pos())
 
         if self.is_flying():
             self.launch_physics(dt, screen_h)
@@ -200,8 +214,8 @@ class Rocket:
     def apply_rotation(self):
         """Apply the current rotation angle to the sprite"""
         if self.angle != 0.0:
-            # Rotate the base image
-            rotated = pygame.transform.rotate(self.base_image, self.angle)
+            # Nearest pre-rotated copy of the base image
+            rotated = self.rotations.get(self.angle)
             # Preserve the center position
             center = self.rocket_rect.center
             self.rocket = rotated
@@ -224,7 +238,8 @@ class Rocket:
 
         w = int(screen_w * self.size_ratio[0])
         h = int(screen_h * self.size_ratio[1])
-        self.base_image = pygame.transform.smoothscale(self.image_original, (w, h))
+        self.base_image = self.scaled_image(w, h)
+        self.rotations.set_image(self.base_image)
 
         x = int(screen_w * self.x_ratio - w / 2)
         y = int(screen_h - h - (screen_h * self.y_offset_ratio))
@@ -233,11 +248,41 @@ class Rocket:
         self.rocket_rect = self.rocket.get_rect(topleft=(x, y))
         self.original_pos = (x, y)
 
-    def draw(self, screen: pygame.Surface):
+    def set_image(self, image: pygame.Surface):
+        """Swap the original image (e.g. converted again), keeping the size."""
+        self.image_original = image
+        self._scaled.clear()
+        self.base_image = self.scaled_image(*self.base_image.get_size())
+        self.rotations.set_image(self.base_image)
+        if not self.angle:
+            self.rocket = self.base_image
+
+    def scaled_image(self, w: int, h: int) -> pygame.Surface:
+        """The original image scaled to (w, h), scaled once per size."""
+        key = (w, h, self.smooth_scale)
+        image = self._scaled.get(key)
+        if image is None:
+            scale = (
+                pygame.transform.smoothscale
+                if self.smooth_scale
+                else pygame.transform.scale
+            )
+            image = scale(self.image_original, (w, h))
+            self._scaled[key] = image
+        return image
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0):
+        """``alpha`` is the fixed-timestep interpolation between updates."""
         if self.hover and not self.clicked:
             self.draw_overlay(screen)
 
-        screen.blit(self.rocket, self.rocket_rect)
+        rect = self.rocket_rect
+        if alpha < 1.0 and self.is_flying():
+            rect = rect.copy()
+            rect.centery = round(
+                self._prev_centery + (rect.centery - self._prev_centery) * alpha
+            )
+        screen.blit(self.rocket, rect)
 
         if self.hover and not self.clicked:
             self.draw_hover_squares(screen)
@@ -246,9 +291,7 @@ class Rocket:
             self.draw_launch_particals(screen)
 
     def draw_overlay(self, screen: pygame.Surface):
-        overlay = pygame.Surface(self.rocket_rect.size, pygame.SRCALPHA)
-        overlay.fill((*Colors.BLACK, self.overlay_alpha))
-        screen.blit(overlay, self.rocket_rect.topleft)
+        tint(screen, (*Colors.BLACK, self.overlay_alpha), self.rocket_rect)
 
     def draw_launch_particals(self, screen: pygame.Surface):
         for _ in range(3):
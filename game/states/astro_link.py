@@ -2,16 +2,32 @@ import pygame
 import gif_pygame
 import math
 from game.core import BaseState, logger
-from game.ui import FadeTransition, Colors
+from game.ui import FadeTransition, Colors, AnimatedBackground, tint
 from game.utils import *
 from game.widgets import Button, TextLine, MultiLine
 from .states import States
 
 
 class AstroLink(BaseState):
+    assets = (
+        "astro_link_bg_gif",
+        "astro_link_spacecraft",
+        "astro_link_satellite",
+        "astro_link_ground_station",
+        "astro_link_beam_sound",
+        "astro_link_success_sound",
+        "win",
+        "button_click",
+    )
+
     def __init__(self, game=None):
         super().__init__(States.ASTRO_LINK, game)
 
+        # quality: translucent wave rings (plain rings when low)
+        self.wave_quality = self.game.quality.register(
+            "astro_link_waves", (False, True, True)
+        )
+
         self.fade_transition = FadeTransition(
             size=(self.game.width, self.game.height),
             starting_alpha=255,
@@ -19,30 +35,17 @@ class AstroLink(BaseState):
             speed=100,
         )
 
-        bg_gif_path = resource_path("assets/gifs/astro_link_bg.gif")
-        with open(bg_gif_path, "rb") as f:
-            gif_bytes = f.read()
-
-        self.bg_gif = load_gif_from_bytes(gif_bytes)
-        self.bg_frame_index = 0
-        self.bg_frame_delay = 60  # ms per frame
-        self.bg_frame_timer = 0
+        # background GIF (loaded in load_assets)
+        self.bg_gif = []
+        self.bg_frame_durations = []
+        self.bg_anim = None
 
         self.bg_gif_surf = None
 
-        # Load images
-        self.spacecraft_img_original = pygame.image.load(
-            resource_path("assets/images/spacecraft.png")
-        ).convert_alpha()
-
-        self.satellite_img = pygame.image.load(
-            resource_path("assets/images/satellite.png")
-        ).convert_alpha()
-
-        self.ground_station_img = pygame.image.load(
-            resource_path("assets/images/ground_station.png")
-        ).convert_alpha()
-        self.ground_station_img.set_alpha(200)
+        # Images (loaded in load_assets)
+        self.spacecraft_img_original = None
+        self.satellite_img = None
+        self.ground_station_img = None
 
         # Dynamic sizing
         self.spacecraft_size_ratio = (0.10, 0.16)
@@ -91,19 +94,6 @@ class AstroLink(BaseState):
         self.transmission_timer = 0.0
         self.transmission_duration = 3.0  # 3 seconds to win
 
-        # Load sounds
-        self.game.sound_manager.load_sound(
-            "beam_connect",
-            resource_path("assets/sound/sfx/beam_connect.mp3"),
-        )
-        self.game.sound_manager.load_sound(
-            "transmission_success",
-            resource_path("assets/sound/sfx/transmission_success.mp3"),
-        )
-        self.game.sound_manager.load_sound(
-            "win", resource_path("assets/sound/sfx/win.mp3")
-        )
-
         # Game state
         self.level_complete = False
         self._played_win_sound = False
@@ -138,6 +128,8 @@ class AstroLink(BaseState):
             start_y_ratio=0.025,
             line_spacing_ratio=0.015,
             game_size=self.game.size,
+            layout=self.game.text_layout,
+            max_width_ratio=0.95,
         )
 
         # Next Level button
@@ -152,15 +144,47 @@ class AstroLink(BaseState):
             hover_font_color=Colors.DARK_GREEN,
             clicked_color=Colors.DARK_GREEN,
             clicked_font_color=Colors.PLATINUM,
-            click_sound=pygame.Sound(
-                resource_path("assets/sound/sfx/button_click.mp3")
-            ),
             size_ratio=(0.15, 0.06),
             screen_size=self.game.size,
             border_radius=12,
         )
 
+    def load_assets(self):
+        assets = self.game.assets
+
+        self.bg_gif, self.bg_frame_durations = assets.gif("astro_link_bg_gif", self)
+        self.bg_anim = AnimatedBackground(self.bg_gif, self.bg_frame_durations)
+
+        # Load images
+        self.spacecraft_img_original = assets.image("astro_link_spacecraft", self)
+        self.spacecraft_img = self.spacecraft_img_original
+
+        self.satellite_img = assets.image("astro_link_satellite", self)
+
+        self.ground_station_img = assets.image("astro_link_ground_station", self)
+        self.ground_station_img.set_alpha(200)
+
+        # Load sounds
+        self.load_sound("beam_connect", "astro_link_beam_sound")
+        self.load_sound("transmission_success", "astro_link_success_sound")
+        self.load_sound("win", "win")
+
+        self.next_button.click_sound = assets.sound("button_click", self)
+
+    def unload_assets(self):
+        super().unload_assets()
+        self.bg_gif = []
+        self.bg_frame_durations = []
+        self.bg_anim = None
+        self.bg_gif_surf = None
+        self.spacecraft_img_original = self.spacecraft_img = None
+        self.spacecraft_scaled_original = self.spacecraft = None
+        self.satellite_img = self.satellite = None
+        self.ground_station_img = self.ground_station = None
+        self.next_button.click_sound = None
+
     def startup(self):
+        super().startup()
         pygame.display.set_caption(self.name.value)
         self.fade_transition.startup()
         self.next_button.startup()
@@ -196,7 +220,7 @@ class AstroLink(BaseState):
         sc_h = int(h * self.spacecraft_size_ratio[1])
 
         self.spacecraft_scaled_original = pygame.transform.scale(
-            self.spacecraft_img, (sc_w, sc_h)
+            self.spacecraft_img_original, (sc_w, sc_h)
         )
         self.spacecraft = self.spacecraft_scaled_original.copy()
 
@@ -207,7 +231,10 @@ class AstroLink(BaseState):
         # Satellite
         sat_w = int(w * self.satellite_size_ratio[0])
         sat_h = int(h * self.satellite_size_ratio[1])
-        self.satellite = pygame.transform.scale(self.satellite_img, (sat_w, sat_h))
+        self.satellite = to_display_format(
+            pygame.transform.scale(self.satellite_img, (sat_w, sat_h)),
+            SurfaceKind.STATIC,
+        )
         self.satellite_rect = self.satellite.get_rect(
             center=(
                 int(w * self.satellite_pos_ratio[0]),
@@ -218,8 +245,9 @@ class AstroLink(BaseState):
         # Ground station
         gs_w = int(w * self.ground_station_size_ratio[0])
         gs_h = int(h * self.ground_station_size_ratio[1])
-        self.ground_station = pygame.transform.scale(
-            self.ground_station_img, (gs_w, gs_h)
+        self.ground_station = to_display_format(
+            pygame.transform.scale(self.ground_station_img, (gs_w, gs_h)),
+            SurfaceKind.STATIC,
         )
         self.ground_station_rect = self.ground_station.get_rect(
             center=(
@@ -287,34 +315,13 @@ class AstroLink(BaseState):
                 self._trigger_win()
 
     def update(self, screen, dt):
-        # If GIF delay accidentally left large, reduce to reasonable frame interval:
-        if hasattr(self, "bg_frame_delay") and self.bg_frame_delay > 1.0:
-            # likely value from earlier bug — use ~120ms per frame
-            self.bg_frame_delay = 0.12
-
         # Background GIF (dt is seconds)
-        self.bg_frame_timer += dt
-        if self.bg_frame_timer >= self.bg_frame_delay:
-            self.bg_frame_timer = 0.0
-            # protect against empty gif frames
-            if self.bg_gif:
-                self.bg_frame_index = (self.bg_frame_index + 1) % len(self.bg_gif)
-        if self.bg_gif:
-            bg_frame = self.bg_gif[self.bg_frame_index]
-            # scale each frame to screen size
-            try:
-                self.bg_gif_surf = pygame.transform.scale(bg_frame, self.game.size)
-            except Exception:
-                # fallback: if frame isn't a surface, ignore
-                self.bg_gif_surf = None
-
-        # text block
-        self.text_block.update(self.game.size)
+        self.bg_anim.update(dt)
+        self.bg_gif_surf = self.bg_anim.current(self.game.size)
 
         # Handle Resize
-        current_sc_w = int(self.game.width * self.spacecraft_size_ratio[0])
-        # Check against scaled original width to detect resize
-        if self.spacecraft_scaled_original.get_width() != current_sc_w:
+        if self.layout_changed():
+            self.text_block.update(self.game.size)
             self._scale_images()
 
         # Update Orbit
@@ -373,8 +380,7 @@ class AstroLink(BaseState):
                 self.waves.remove(wave)
 
     def draw(self, screen: pygame.Surface):
-        if self.bg_gif_surf:
-            screen.blit(self.bg_gif_surf, (0, 0))
+        self.draw_background(screen, self.bg_gif_surf)
 
         if not self.level_complete:
             self.text_block.draw(screen)
@@ -418,6 +424,11 @@ class AstroLink(BaseState):
             # Alpha fades out (255 -> 0)
             alpha = int(255 * (1 - t))
 
+            # Low quality: opaque ring straight on the screen
+            if not self.wave_quality.value:
+                pygame.draw.circle(screen, Colors.GREEN, (cur_x, cur_y), radius, 2)
+                continue
+
             # Draw simple circle pulse
             s = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
             pygame.draw.circle(s, (*Colors.GREEN, alpha), (radius, radius), radius, 2)
@@ -504,9 +515,7 @@ class AstroLink(BaseState):
 
     def _draw_win_ui(self, screen: pygame.Surface):
         w, h = screen.get_size()
-        overlay = pygame.Surface(self.game.size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        tint(screen, (0, 0, 0, 180))
 
         if not self._played_win_sound:
             self.game.sound_manager.play_sound("win")
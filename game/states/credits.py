@@ -1,12 +1,17 @@
+from bisect import bisect_left
+
 import pygame
 import pygame.freetype
 from game.core import BaseState
-from game.utils import resource_path
-from game.ui import Colors
+from game.ui import Colors, tint
 from .states import States
 
 
 class Credits(BaseState):
+    assets = ("credits_music",)
+    likely_next = (States.MENU,)
+    partial_redraw = True
+
     def __init__(self, game=None):
         super().__init__(States.CREDITS, game)
 
@@ -14,20 +19,33 @@ class Credits(BaseState):
         self.text_items = []
         self.total_content_height = 0
         self.scroll_y = 0.0
+        self._drawn_rects = []  # text rects of the last frame, for dirty rects
+        self._item_tops = []  # rel_y of every text item, for bisecting
+        self._max_item_height = 0
+
+        # content baked into tall tiles, so scrolling is one or two blits;
+        # baked on startup, most players never open the credits
+        self.tiles = []
+        self.tile_height = 0
+        self._tiles_size = None  # screen size the tiles were baked for
 
         # --- FADE OUT LOGIC ---
         self.is_exiting = False
         self.exit_start_time = 0
         self.fade_duration = 2000  # 2 seconds to fade out music
-        self.fade_surface = pygame.Surface(self.game.size, pygame.SRCALPHA)
+        self.fade_alpha = 0
         # ----------------------
 
+    def _layout(self):
+        """Lay the credits out for the current screen size and bake the tiles."""
         w, h = self.game.size
         self.section_spacing = int(h * 0.07)
         self.line_spacing = int(h * 0.02)
         self.base_font_size = self.game.size_depended(22)
 
         self._create_credits_text()
+        self._bake_tiles()
+        self._tiles_size = self.game.size
 
     def _create_credits_text(self):
         lines = []
@@ -73,6 +91,7 @@ class Credits(BaseState):
         # --- Generation Logic ---
         self.text_items.clear()
         current_rel_y = 0
+        max_width = int(self.game.width * 0.9)
 
         for text, color, bold in lines:
             if text == "":
@@ -82,31 +101,90 @@ class Credits(BaseState):
             style = (
                 pygame.freetype.STYLE_STRONG if bold else pygame.freetype.STYLE_DEFAULT
             )
-            surf, rect = self.game.font.render(
-                text, color, size=self.base_font_size, style=style
+            # long lines (the GitHub link) wrap instead of running off screen
+            surf, rect = self.game.text_layout.block(
+                text,
+                color,
+                max_width,
+                size=self.base_font_size,
+                style=style,
+                line_spacing=self.line_spacing,
             )
             self.text_items.append((surf, current_rel_y))
             current_rel_y += rect.height + self.line_spacing
 
         self.total_content_height = current_rel_y
+        self._item_tops = [rel_y for _, rel_y in self.text_items]
+        self._max_item_height = max(
+            (surf.get_height() for surf, _ in self.text_items), default=0
+        )
+
+    def _bake_tiles(self):
+        """Render ``text_items`` onto opaque tiles at least a screen tall.
+
+        At most two tiles are ever on screen, however long the credits are.
+        """
+        width = max((surf.get_width() for surf, _ in self.text_items), default=1)
+        self.tile_height = max(1024, self.game.height)
+        count = max(1, -(-self.total_content_height // self.tile_height))
+
+        self.tiles = []
+        for i in range(count):
+            tile = pygame.Surface((width, self.tile_height)).convert()
+            tile.fill(Colors.DEEP_SPACE_BLUE)
+            top = i * self.tile_height
+            for surf, rel_y in self.text_items:
+                # items crossing a tile edge are drawn on both tiles
+                if rel_y < top + self.tile_height and rel_y + surf.get_height() > top:
+                    tile.blit(surf, ((width - surf.get_width()) // 2, rel_y - top))
+            self.tiles.append(tile)
+
+    def load_assets(self):
+        try:
+            self.load_sound("credits", "credits_music")
+        except Exception:
+            pass
+
+    def unload_assets(self):
+        super().unload_assets()
+        # the baked text goes too, startup bakes it again
+        self.text_items = []
+        self.tiles = []
+        self._tiles_size = None
 
     def startup(self):
+        super().startup()
         pygame.display.set_caption("Credits")
+        if self._tiles_size != self.game.size:
+            self._layout()
         self.scroll_y = float(self.game.height)
+        self._drawn_rects = []
 
         # Reset exit state
         self.is_exiting = False
-        self.fade_surface.fill((0, 0, 0, 0))  # Transparent
+        self.fade_alpha = 0  # Transparent
 
         try:
-            self.game.sound_manager.load_sound(
-                "credits", resource_path("assets/sound/music/moog_city_2_c418.mp3")
-            )
             # Fade in slightly for smoothness
             self.game.sound_manager.play_sound("credits", fade_ms=1000)
         except Exception:
             pass
 
+    def _visible_text_rects(self, top: int, tile_x: int, tile_w: int) -> list:
+        """Screen rects of the text items on screen, found by bisecting."""
+        screen_rect = pygame.Rect((0, 0), self.game.size)
+        first = bisect_left(self._item_tops, -top - self._max_item_height)
+        rects = []
+        for surf, rel_y in self.text_items[first:]:
+            y = top + rel_y
+            if y >= screen_rect.h:
+                break
+            x = tile_x + (tile_w - surf.get_width()) // 2
+            rect = pygame.Rect((x, y), surf.get_size()).clip(screen_rect)
+            if rect.w and rect.h:
+                rects.append(rect)
+        return rects
+
     def trigger_exit(self):
         """Helper to start the exit sequence (music fade + visual fade)."""
         if self.is_exiting:
@@ -131,14 +209,17 @@ class Credits(BaseState):
 
             # Calculate alpha for visual fade out (0 to 255)
             # This makes the screen go black smoothly while music fades
-            alpha = min(255, int((time_passed / self.fade_duration) * 255))
-            self.fade_surface.fill((0, 0, 0, alpha))
+            self.fade_alpha = min(255, int((time_passed / self.fade_duration) * 255))
 
             # If time is up, FINALLY switch state
             if time_passed >= self.fade_duration:
                 self.game.sm.set_state(States.MENU)
             return  # Skip scrolling logic if we are fading out
 
+        # re-bake for a new resolution
+        if self.layout_changed() and self._tiles_size != self.game.size:
+            self._layout()
+
         # 2. Normal Scrolling Logic
         self.scroll_y -= self.scroll_speed * dt
         credits_bottom = self.scroll_y + self.total_content_height
@@ -149,16 +230,38 @@ class Credits(BaseState):
 
     def draw(self, screen):
         screen.fill(Colors.DEEP_SPACE_BLUE)
+        if not self.tiles:
+            return  # not baked before the first startup
 
         screen_w = self.game.width
         screen_h = self.game.height
 
-        for surf, rel_y in self.text_items:
-            draw_y = self.scroll_y + rel_y
-            if -50 < draw_y < screen_h + 50:
-                draw_x = (screen_w - surf.get_width()) // 2
-                screen.blit(surf, (draw_x, int(draw_y)))
+        # only the tiles under the screen, found by offset instead of a scan
+        backend = self.game.renderer_backend
+        top = int(self.scroll_y)
+        tile_w = self.tiles[0].get_width()
+        draw_x = (screen_w - tile_w) // 2
+        first = max(0, -top // self.tile_height)
+        for i in range(first, len(self.tiles)):
+            tile_y = top + i * self.tile_height
+            if tile_y >= screen_h:
+                break
+            tile = self.tiles[i]
+            if backend:
+                # tiles are static: uploaded once, composed by the renderer
+                backend.draw(tile, (draw_x, tile_y), 255 - self.fade_alpha)
+            else:
+                screen.blit(tile, (draw_x, tile_y))
+
+        # the tiles cover the whole screen height, but only the text changes
+        drawn_rects = [] if backend else self._visible_text_rects(top, draw_x, tile_w)
+
+        # only the text moves: present where it was and where it is now
+        for rect in self._drawn_rects + drawn_rects:
+            self.mark_dirty(rect)
+        self._drawn_rects = drawn_rects
 
         # Draw the black fade overlay (invisible unless is_exiting is True)
         if self.is_exiting:
-            screen.blit(self.fade_surface, (0, 0))
+            tint(screen, (0, 0, 0, self.fade_alpha))
+            self.mark_dirty()
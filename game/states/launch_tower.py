@@ -1,7 +1,7 @@
 import pygame
 import gif_pygame
 from game.core import BaseState
-from game.ui import FadeTransition, Colors
+from game.ui import FadeTransition, Colors, AnimatedBackground, tint
 from game.utils import *
 from .states import States
 from game.entities import Rocket
@@ -9,8 +9,24 @@ from game.widgets import TextLine, MultiLine, Button
 
 
 class LaunchTower(BaseState):
+    assets = (
+        "launch_tower_bg_gif",
+        "rocket_image",
+        "rocket_dying",
+        "rocket_flying",
+        "win",
+        "button_click",
+    )
+
     def __init__(self, game=None):
         super().__init__(States.LAUNCH_TOWER, game)
+
+        # quality: smoothscale or scale for the rockets
+        self.smooth_quality = self.game.quality.register(
+            "launch_tower_smooth_scale",
+            (False, True, True),
+            on_change=self._set_rocket_smoothing,
+        )
         self.current_rocket = None  # track the current active rocket
 
         self.fade_transition = FadeTransition(
@@ -19,14 +35,10 @@ class LaunchTower(BaseState):
             ending_alpha=0,
         )
 
-        bg_gif_path = resource_path("assets/gifs/launch_tower_bg.gif")
-        with open(bg_gif_path, "rb") as f:
-            gif_bytes = f.read()
-
-        self.bg_gif = load_gif_from_bytes(gif_bytes)
-        self.bg_frame_index = 0
-        self.bg_frame_delay = 0.5  # ms per frame
-        self.bg_frame_timer = 0
+        # background GIF (loaded in load_assets)
+        self.bg_gif = []
+        self.bg_frame_durations = []
+        self.bg_anim = None
 
         self.bg_gif_surf = None
 
@@ -59,10 +71,47 @@ class LaunchTower(BaseState):
             start_y_ratio=0.025,
             line_spacing_ratio=0.015,
             game_size=self.game.size,
+            layout=self.game.text_layout,
+            max_width_ratio=0.95,
+        )
+
+        # --- rockets (created in load_assets) ---
+        self.rockets_list = []
+
+        # track clicks
+        self.clicks_count = 0
+
+        self.strong_rocket = None
+        self.start_finish = False
+        self._played_win_sound = False
+
+        # --- next button ---
+        self.next_button = Button(
+            color=Colors.DARK_GREEN,
+            function=self.game.sm.next_state,
+            text="Next Level",
+            font=self.game.font,
+            font_color=Colors.PLATINUM,
+            call_on_release=True,
+            hover_color=Colors.KHAKI_PLAT,
+            hover_font_color=Colors.DARK_GREEN,
+            clicked_color=Colors.DARK_GREEN,
+            clicked_font_color=Colors.PLATINUM,
+            size_ratio=(0.15, 0.06),  # 15% width, 6% height of screen
+            screen_size=self.game.screen.get_size(),
+            border_radius=12,
         )
 
+    def load_assets(self):
+        assets = self.game.assets
+
+        self.bg_gif, self.bg_frame_durations = assets.gif("launch_tower_bg_gif", self)
+        self.bg_anim = AnimatedBackground(self.bg_gif, self.bg_frame_durations)
+
         # --- rockets ---
         r_size_ratio = (0.08, 0.18)
+        rocket_image = assets.image("rocket_image", self)
+        smooth_rotation = self.game.ss.get("smooth_rotation", False)
 
         self.rockets_list = [
             Rocket(
@@ -71,6 +120,8 @@ class LaunchTower(BaseState):
                 y_offset_ratio=0.03,
                 speed=200.0,
                 fall=True,
+                image=rocket_image,
+                smooth_rotation=smooth_rotation,
             ),
             Rocket(
                 size_ratio=r_size_ratio,
@@ -78,6 +129,8 @@ class LaunchTower(BaseState):
                 y_offset_ratio=0.03,
                 speed=200.0,
                 fall=True,
+                image=rocket_image,
+                smooth_rotation=smooth_rotation,
             ),
             Rocket(
                 size_ratio=r_size_ratio,
@@ -85,50 +138,48 @@ class LaunchTower(BaseState):
                 y_offset_ratio=0.03,
                 speed=200.0,
                 fall=True,
+                image=rocket_image,
+                smooth_rotation=smooth_rotation,
             ),
         ]
 
+        dying_sound = assets.sound("rocket_dying", self)
+        flying_sound = assets.sound("rocket_flying", self)
         for r in self.rockets:
-            r.dying_sound = pygame.Sound(
-                resource_path("assets/sound/sfx/rocket_dying.mp3")
-            )
-            r.flying_sound = pygame.Sound(
-                resource_path("assets/sound/sfx/rocket_flying.mp3")
-            )
+            r.dying_sound = dying_sound
+            r.flying_sound = flying_sound
+        self._set_rocket_smoothing(self.smooth_quality.value)
 
         # win sound
-        self.game.sound_manager.load_sound(
-            "win", resource_path("assets/sound/sfx/win.mp3")
-        )
-
-        # track clicks
-        self.clicks_count = 0
-
-        self.strong_rocket = None
-        self.start_finish = False
-        self._played_win_sound = False
-
-        # --- next button ---
-        self.next_button = Button(
-            color=Colors.DARK_GREEN,
-            function=self.game.sm.next_state,
-            text="Next Level",
-            font=self.game.font,
-            font_color=Colors.PLATINUM,
-            call_on_release=True,
-            hover_color=Colors.KHAKI_PLAT,
-            hover_font_color=Colors.DARK_GREEN,
-            clicked_color=Colors.DARK_GREEN,
-            clicked_font_color=Colors.PLATINUM,
-            click_sound=pygame.Sound(
-                resource_path("assets/sound/sfx/button_click.mp3")
-            ),
-            size_ratio=(0.15, 0.06),  # 15% width, 6% height of screen
-            screen_size=self.game.screen.get_size(),
-            border_radius=12,
-        )
+        self.load_sound("win", "win")
+
+        self.next_button.click_sound = assets.sound("button_click", self)
+
+    def _set_rocket_smoothing(self, smooth: bool):
+        for rocket in self.rockets:
+            rocket.smooth_scale = smooth
+
+    def reacquire_assets(self):
+        # keep the rockets (a launch may be under way), only swap the image
+        rocket_image = self.game.assets.image("rocket_image", self)
+        for rocket in self.rockets:
+            rocket.set_image(rocket_image)
+        self.bg_anim.invalidate()
+        self.relayout()
+
+    def unload_assets(self):
+        super().unload_assets()
+        self.bg_gif = []
+        self.bg_frame_durations = []
+        self.bg_anim = None
+        self.bg_gif_surf = None
+        # the rockets hold the image, its scales and rotations, and sounds
+        self.rockets_list = []
+        self.current_rocket = None
+        self.next_button.click_sound = None
 
     def startup(self):
+        super().startup()
         pygame.display.set_caption(self.name.value)
         self.fade_transition.startup()
         self.next_button.startup()
@@ -172,15 +223,14 @@ class LaunchTower(BaseState):
         shake_x, shake_y = self.get_screen_shake_offset()
 
         # background
-        if self.bg_gif_surf:
-            screen.blit(self.bg_gif_surf, (shake_x, shake_y))
+        self.draw_background(screen, self.bg_gif_surf, (shake_x, shake_y))
 
         # text block
         self.text_block.draw(screen)
 
         # draw all rockets
         for rocket in self.rockets_list:
-            rocket.draw(screen)
+            rocket.draw(screen, self.game.interpolation)
 
         if self.start_finish:
             self.finish_animation(screen)
@@ -189,29 +239,13 @@ class LaunchTower(BaseState):
         self.fade_transition.draw(screen)
 
     def update(self, screen, dt):
-        # If GIF delay accidentally left large, reduce to reasonable frame interval:
-        if hasattr(self, "bg_frame_delay") and self.bg_frame_delay > 1.0:
-            # likely value from earlier bug — use ~120ms per frame
-            self.bg_frame_delay = 0.12
-
         # Background GIF (dt is seconds)
-        self.bg_frame_timer += dt
-        if self.bg_frame_timer >= self.bg_frame_delay:
-            self.bg_frame_timer = 0.0
-            # protect against empty gif frames
-            if self.bg_gif:
-                self.bg_frame_index = (self.bg_frame_index + 1) % len(self.bg_gif)
-        if self.bg_gif:
-            bg_frame = self.bg_gif[self.bg_frame_index]
-            # scale each frame to screen size
-            try:
-                self.bg_gif_surf = pygame.transform.scale(bg_frame, self.game.size)
-            except Exception:
-                # fallback: if frame isn't a surface, ignore
-                self.bg_gif_surf = None
+        self.bg_anim.update(dt)
+        self.bg_gif_surf = self.bg_anim.current(self.game.size)
 
         # update text layout on resize
-        self.text_block.update(self.game.size)
+        if self.layout_changed():
+            self.text_block.update(self.game.size)
 
         # update all rockets
         for rocket in self.rockets_list:
@@ -232,9 +266,7 @@ class LaunchTower(BaseState):
     def finish_animation(self, screen: pygame.Surface):
         w, h = screen.get_size()
 
-        overlay = pygame.Surface(self.game.size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        tint(screen, (0, 0, 0, 180))
 
         if not self._played_win_sound:
             self.game.sound_manager.play_sound("win")
@@ -2,16 +2,41 @@ import pygame
 import random
 import math
 from game.core import BaseState, logger
-from game.ui import FadeTransition, Colors
-from game.utils import resource_path, load_gif_from_bytes, mid_pos
+from game.ui import FadeTransition, Colors, AnimatedBackground, tint
+from game.utils import resource_path, mid_pos, to_display_format, SurfaceKind
 from .states import States
 from game.widgets import Button, TextLine, MultiLine
+from game.entities import ParticleSystem
 
 
 class LifeSupport(BaseState):
+    assets = (
+        "life_support_bg_gif",
+        "life_support_icon_o2",
+        "life_support_icon_temp",
+        "life_support_icon_water",
+        "life_support_icon_radiation",
+        "alert_warning",
+        "emergency_fix",
+        "win",
+        "button_click",
+    )
+
     def __init__(self, game=None):
         super().__init__(States.LIFE_SUPPORT, game)
 
+        # quality: critical glows, particle count and icon scaling
+        quality = self.game.quality
+        self.glow_quality = quality.register("life_support_glow", (False, True, True))
+        self.particle_quality = quality.register(
+            "life_support_particles", (0.25, 0.5, 1.0)
+        )
+        self.smooth_quality = quality.register(
+            "life_support_smooth_scale",
+            (False, True, True),
+            on_change=lambda _: self.relayout(),
+        )
+
         # Fade transition
         self.fade_transition = FadeTransition(
             size=(self.game.width, self.game.height),
@@ -21,28 +46,17 @@ class LifeSupport(BaseState):
         )
 
         # --- Background GIF ---
-        bg_gif_path = resource_path("assets/gifs/lifesupport_bg.gif")
-        with open(bg_gif_path, "rb") as f:
-            gif_bytes = f.read()
-        self.bg_gif = load_gif_from_bytes(gif_bytes)
-        self.bg_frame_index = 0
-        self.bg_frame_delay = 60
-        self.bg_frame_timer = 0
+        # (loaded in load_assets)
+        self.bg_gif = []
+        self.bg_frame_durations = []
+        self.bg_anim = None
         self.bg_gif_surf = None
 
-        # --- Icons (original assets) ---
-        self.icon_o2_orig = pygame.image.load(
-            resource_path("assets/images/icon_o2.png")
-        ).convert_alpha()
-        self.icon_temp_orig = pygame.image.load(
-            resource_path("assets/images/icon_temp.png")
-        ).convert_alpha()
-        self.icon_water_orig = pygame.image.load(
-            resource_path("assets/images/icon_water.png")
-        ).convert_alpha()
-        self.icon_rad_orig = pygame.image.load(
-            resource_path("assets/images/icon_radiation.png")
-        ).convert_alpha()
+        # --- Icons (original assets, loaded in load_assets) ---
+        self.icon_o2_orig = None
+        self.icon_temp_orig = None
+        self.icon_water_orig = None
+        self.icon_rad_orig = None
 
         # Scaled versions
         self.icon_o2 = None
@@ -97,7 +111,6 @@ class LifeSupport(BaseState):
 
         # --- Buttons with new colors ---
         btn_size_ratio = (0.16, 0.07)
-        click_sound = pygame.Sound(resource_path("assets/sound/sfx/button_click.mp3"))
 
         self.btn_o2 = Button(
             color=Colors.CYBER_BLUE,
@@ -107,7 +120,6 @@ class LifeSupport(BaseState):
             font=self.game.font,
             font_color=Colors.FROST_WHITE,
             call_on_release=True,
-            click_sound=click_sound,
             size_ratio=btn_size_ratio,
             screen_size=self.game.size,
             border_radius=8,
@@ -120,7 +132,6 @@ class LifeSupport(BaseState):
             font=self.game.font,
             font_color=Colors.FROST_WHITE,
             call_on_release=True,
-            click_sound=click_sound,
             size_ratio=btn_size_ratio,
             screen_size=self.game.size,
             border_radius=8,
@@ -133,7 +144,6 @@ class LifeSupport(BaseState):
             font=self.game.font,
             font_color=Colors.DEEP_SPACE_BLUE,
             call_on_release=True,
-            click_sound=click_sound,
             size_ratio=btn_size_ratio,
             screen_size=self.game.size,
             border_radius=8,
@@ -146,7 +156,6 @@ class LifeSupport(BaseState):
             font=self.game.font,
             font_color=Colors.FROST_WHITE,
             call_on_release=True,
-            click_sound=click_sound,
             size_ratio=btn_size_ratio,
             screen_size=self.game.size,
             border_radius=8,
@@ -163,9 +172,6 @@ class LifeSupport(BaseState):
             hover_font_color=Colors.DARK_GREEN,
             clicked_color=Colors.DARK_GREEN,
             clicked_font_color=Colors.PLATINUM,
-            click_sound=pygame.Sound(
-                resource_path("assets/sound/sfx/button_click.mp3")
-            ),
             size_ratio=(0.15, 0.06),
             screen_size=self.game.size,
             border_radius=12,
@@ -193,17 +199,48 @@ class LifeSupport(BaseState):
             start_y_ratio=0.025,
             line_spacing_ratio=0.0185,
             game_size=self.game.size,
+            layout=self.game.text_layout,
+            max_width_ratio=0.95,
         )
 
         # --- Visual effects ---
-        self.particles = []  # for visual polish
+        self.particles = ParticleSystem()  # for visual polish
+
+    # ----------------- Lifecycle -----------------
+    def load_assets(self):
+        assets = self.game.assets
+
+        self.bg_gif, self.bg_frame_durations = assets.gif("life_support_bg_gif", self)
+        self.bg_anim = AnimatedBackground(self.bg_gif, self.bg_frame_durations)
+
+        self.icon_o2_orig = assets.image("life_support_icon_o2", self)
+        self.icon_temp_orig = assets.image("life_support_icon_temp", self)
+        self.icon_water_orig = assets.image("life_support_icon_water", self)
+        self.icon_rad_orig = assets.image("life_support_icon_radiation", self)
+
+        # only the next button clicks on its own, the system buttons play
+        # "click" when their action actually happens
+        self.next_button.click_sound = assets.sound("button_click", self)
 
         # Initial scaling
         self._scale_images()
         self._scale_controls()
 
-    # ----------------- Lifecycle -----------------
+    def unload_assets(self):
+        super().unload_assets()
+        self.bg_gif = []
+        self.bg_frame_durations = []
+        self.bg_anim = None
+        self.bg_gif_surf = None
+        self.sound_loaded = False
+        self.icon_o2_orig = self.icon_o2 = None
+        self.icon_temp_orig = self.icon_temp = None
+        self.icon_water_orig = self.icon_water = None
+        self.icon_rad_orig = self.icon_rad = None
+        self.next_button.click_sound = None
+
     def startup(self):
+        super().startup()
         pygame.display.set_caption(self.name.value)
         self.fade_transition.startup()
         self.btn_o2.startup()
@@ -212,16 +249,6 @@ class LifeSupport(BaseState):
         self.btn_radshield.startup()
         self.next_button.startup()
 
-        # Disable the Button's internal click sound (we play click only when action succeeds)
-        # Some Button implementations expose the attr directly; if yours doesn't this will be a no-op.
-        try:
-            self.btn_o2.click_sound = None
-            self.btn_temp.click_sound = None
-            self.btn_water.click_sound = None
-            self.btn_radshield.click_sound = None
-        except Exception:
-            pass
-
         # Reset all state
         self.o2 = 100.0
         self.temp = 100.0
@@ -271,20 +298,15 @@ class LifeSupport(BaseState):
             return
 
         sounds_to_load = [
-            ("alert", "assets/sound/sfx/alert_warning.mp3"),
-            ("fixed", "assets/sound/sfx/emergency_fix.mp3"),
-            ("win", "assets/sound/sfx/win.mp3"),
-            (
-                "click",
-                "assets/sound/sfx/button_click.mp3",
-            ),  # used when action actually occurs
+            ("alert", "alert_warning"),
+            ("fixed", "emergency_fix"),
+            ("win", "win"),
+            ("click", "button_click"),  # used when action actually occurs
         ]
 
-        for sound_name, sound_path in sounds_to_load:
+        for sound_name, sound_key in sounds_to_load:
             try:
-                self.game.sound_manager.load_sound(
-                    sound_name, resource_path(sound_path)
-                )
+                self.load_sound(sound_name, sound_key)
             except Exception as e:
                 logger.warning(f"Could not load sound '{sound_name}': {e}")
 
@@ -296,17 +318,23 @@ class LifeSupport(BaseState):
         w, h = self.game.size
         icon_size = int(min(w, h) * 0.08)
 
-        self.icon_o2 = pygame.transform.smoothscale(
-            self.icon_o2_orig, (icon_size, icon_size)
-        )
-        self.icon_temp = pygame.transform.smoothscale(
-            self.icon_temp_orig, (icon_size, icon_size)
-        )
-        self.icon_water = pygame.transform.smoothscale(
-            self.icon_water_orig, (icon_size, icon_size)
+        # icons are only blitted after this, so they can be RLE encoded
+        scale = (
+            pygame.transform.smoothscale
+            if self.smooth_quality.value
+            else pygame.transform.scale
         )
-        self.icon_rad = pygame.transform.smoothscale(
-            self.icon_rad_orig, (icon_size, icon_size)
+        self.icon_o2, self.icon_temp, self.icon_water, self.icon_rad = (
+            to_display_format(
+                scale(icon, (icon_size, icon_size)),
+                SurfaceKind.STATIC,
+            )
+            for icon in (
+                self.icon_o2_orig,
+                self.icon_temp_orig,
+                self.icon_water_orig,
+                self.icon_rad_orig,
+            )
         )
 
         self.icon_o2_rect = self.icon_o2.get_rect()
@@ -396,11 +424,6 @@ class LifeSupport(BaseState):
 
     # ----------------- Update -----------------
     def update(self, screen, dt):
-        # If GIF delay accidentally left large, reduce to reasonable frame interval:
-        if hasattr(self, "bg_frame_delay") and self.bg_frame_delay > 1.0:
-            # likely value from earlier bug — use ~120ms per frame
-            self.bg_frame_delay = 0.12
-
         if self.level_failed or self.level_complete:
             self.game.sound_manager.stop_sound("alert")
             self.fade_transition.set_size(self.game.size)
@@ -408,20 +431,8 @@ class LifeSupport(BaseState):
             return
 
         # Background GIF (dt is seconds)
-        self.bg_frame_timer += dt
-        if self.bg_frame_timer >= self.bg_frame_delay:
-            self.bg_frame_timer = 0.0
-            # protect against empty gif frames
-            if self.bg_gif:
-                self.bg_frame_index = (self.bg_frame_index + 1) % len(self.bg_gif)
-        if self.bg_gif:
-            bg_frame = self.bg_gif[self.bg_frame_index]
-            # scale each frame to screen size
-            try:
-                self.bg_gif_surf = pygame.transform.scale(bg_frame, self.game.size)
-            except Exception:
-                # fallback: if frame isn't a surface, ignore
-                self.bg_gif_surf = None
+        self.bg_anim.update(dt)
+        self.bg_gif_surf = self.bg_anim.current(self.game.size)
 
         # Update cooldowns
         self.btn_o2_cooldown = max(0.0, self.btn_o2_cooldown - dt)
@@ -478,11 +489,17 @@ class LifeSupport(BaseState):
 
         # Update visual effects
         self.warning_pulse += dt * 3
-        self._update_particles(dt)
+        with self.game.profiler.zone("particles.update"):
+            self.particles.update(dt)
 
-        # Rescale if needed (increase spacing to avoid overlap)
-        self._scale_images()
-        self._scale_controls()
+        # Rescale after a resize (increase spacing to avoid overlap)
+        if self.layout_changed():
+            self._scale_images()
+            self._scale_controls()
+
+        # Buttons (hover)
+        for btn in (self.btn_o2, self.btn_temp, self.btn_water, self.btn_radshield):
+            btn.update(self.game.size)
         self.fade_transition.set_size(self.game.size)
         self.fade_transition.update(dt)
 
@@ -536,27 +553,12 @@ class LifeSupport(BaseState):
             self.level_failed = True
             logger.info(f"LifeSupport: Failed - emergency timeout ({etype})")
 
-    def _update_particles(self, dt):
-        """Update visual particle effects"""
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p["life"] > 0]
-
-        # Update existing particles
-        for p in self.particles:
-            p["x"] += p["vx"] * dt
-            p["y"] += p["vy"] * dt
-            p["life"] -= dt
-
     # ----------------- Drawing -----------------
     def draw(self, screen: pygame.Surface):
-        # Background
-        if self.bg_gif_surf:
-            screen.blit(self.bg_gif_surf, (0, 0))
-
-        # Dark overlay for better contrast
-        overlay = pygame.Surface(self.game.size, pygame.SRCALPHA)
-        overlay.fill((*Colors.DEEP_SPACE_BLUE, 100))
-        screen.blit(overlay, (0, 0))
+        # Background, with a dark overlay for better contrast
+        self.draw_background(
+            screen, self.bg_gif_surf, overlay=(*Colors.DEEP_SPACE_BLUE, 100)
+        )
 
         # Title
         self.text_block.draw(screen)
@@ -568,7 +570,8 @@ class LifeSupport(BaseState):
         self._draw_system_panels(screen)
 
         # Draw particles
-        self._draw_particles(screen)
+        with self.game.profiler.zone("particles.draw"):
+            self.particles.draw(screen)
 
         # Draw buttons
         if not self.level_failed and not self.level_complete:
@@ -656,10 +659,21 @@ class LifeSupport(BaseState):
             ),
         ]
 
+        # the icons are static: the renderer backend composes them on top of
+        # the frame, as long as nothing is drawn over them this frame
+        backend = self.game.renderer_backend
+        icons_on_top = backend and not (
+            self.emergency
+            or self.level_failed
+            or self.level_complete
+            or len(self.particles)
+            or self.fade_transition.alpha
+        )
+
         for icon, rect, label, value, color, sys_type in systems:
             # Warning pulse for critical systems
             is_critical = sys_type in self.critical_states
-            if is_critical:
+            if is_critical and self.glow_quality.value:
                 pulse = abs(math.sin(self.warning_pulse))
                 glow_surf = pygame.Surface((rect.w + 24, rect.h + 24), pygame.SRCALPHA)
                 pygame.draw.circle(
@@ -677,7 +691,10 @@ class LifeSupport(BaseState):
                 )
 
             # Icon
-            screen.blit(icon, rect)
+            if icons_on_top:
+                backend.draw(icon, rect.topleft)
+            else:
+                screen.blit(icon, rect)
 
             # Status bar below icon
             bar_w = int(rect.w * 1.5)
@@ -748,9 +765,7 @@ class LifeSupport(BaseState):
             if any_cooldown:
                 # Use this button's cooldown to draw overlay (0 if not on cooldown)
                 progress = min(1.0, cooldown / self.cooldown_duration)
-                overlay = pygame.Surface(btn.rect.size, pygame.SRCALPHA)
-                overlay.fill((*Colors.DEEP_SPACE_BLUE, int(180 * progress)))
-                screen.blit(overlay, btn.rect.topleft)
+                tint(screen, (*Colors.DEEP_SPACE_BLUE, int(180 * progress)), btn.rect)
 
                 # Draw cooldown text only if this button is actually on cooldown
                 if cooldown > 0:
@@ -767,9 +782,7 @@ class LifeSupport(BaseState):
 
         # Pulsing dark overlay
         pulse = abs(math.sin(pygame.time.get_ticks() / 200.0))
-        overlay = pygame.Surface(self.game.size, pygame.SRCALPHA)
-        overlay.fill((*Colors.CRITICAL_RED, int(60 * pulse)))
-        screen.blit(overlay, (0, 0))
+        tint(screen, (*Colors.CRITICAL_RED, int(60 * pulse)))
 
         # Warning border
         border_thickness = int(10 * pulse) + 5
@@ -804,9 +817,7 @@ class LifeSupport(BaseState):
             max(title_rect.width, sub_rect.width) + 40,
             sub_rect.bottom - title_rect.top + 20,
         )
-        bg_surf = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        bg_surf.fill((*Colors.DEEP_SPACE_BLUE, 200))
-        screen.blit(bg_surf, bg_rect.topleft)
+        tint(screen, (*Colors.DEEP_SPACE_BLUE, 200), bg_rect)
 
         screen.blit(title_surf, title_rect)
         screen.blit(sub_surf, sub_rect)
@@ -814,9 +825,7 @@ class LifeSupport(BaseState):
     def _draw_fail_ui(self, screen):
         """Draw failure screen + restart hint"""
         w, h = self.game.size
-        overlay = pygame.Surface(self.game.size, pygame.SRCALPHA)
-        overlay.fill((*Colors.DEEP_SPACE_BLUE, 220))
-        screen.blit(overlay, (0, 0))
+        tint(screen, (*Colors.DEEP_SPACE_BLUE, 220))
 
         # Ratios for vertical positioning
         title_ratio = 0.4  # 40% down from top
@@ -849,9 +858,7 @@ class LifeSupport(BaseState):
         w, h = screen.get_size()
 
         # Overlay
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        overlay.fill((*Colors.DEEP_SPACE_BLUE, 200))
-        screen.blit(overlay, (0, 0))
+        tint(screen, (*Colors.DEEP_SPACE_BLUE, 200))
 
         # Play win sound only once
         if not self._played_win_sound:
@@ -1024,14 +1031,9 @@ class LifeSupport(BaseState):
             center = (self.game.width // 2, self.game.height // 2)
 
         # burst of particles
-        for _ in range(12):
-            self._spawn_particle(
-                center[0] + random.randint(-8, 8),
-                center[1] + random.randint(-8, 8),
-                Colors.FROST_WHITE,
-                size=random.randint(3, 6),
-                lifetime=random.uniform(0.5, 1.2),
-            )
+        self.particles.emit(
+            center[0], center[1], "repair", scale=self.particle_quality.value
+        )
 
         # play fixed/stabilize sound
         try:
@@ -1045,45 +1047,6 @@ class LifeSupport(BaseState):
         self.emergency_spawn_timer = 0.0
         self.emergency_spawn_interval = random.uniform(12.0, 20.0)
 
-    def _spawn_particle(self, x, y, color, size=4, lifetime=0.6):
-        """Spawn a single particle for effects"""
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(20, 60)
-        self.particles.append(
-            {
-                "x": x,
-                "y": y,
-                "vx": math.cos(angle) * speed,
-                "vy": math.sin(angle) * speed,
-                "color": color,
-                "size": size,
-                "life": lifetime,
-            }
-        )
-
-    def _update_particles(self, dt):
-        """Update and remove expired particles"""
-        new_particles = []
-        for p in self.particles:
-            p["x"] += p["vx"] * dt
-            p["y"] += p["vy"] * dt
-            p["life"] -= dt
-            if p["life"] > 0:
-                new_particles.append(p)
-        self.particles = new_particles
-
-    def _draw_particles(self, screen):
-        """Render particles"""
-        for p in self.particles:
-            # fade by life/initial lifetime approximation (simple)
-            alpha = int(max(0, min(255, 255 * (p["life"] / 1.2))))
-            surf = pygame.Surface((p["size"], p["size"]), pygame.SRCALPHA)
-            col = (p["color"][0], p["color"][1], p["color"][2], alpha)
-            pygame.draw.circle(
-                surf, col, (p["size"] // 2, p["size"] // 2), p["size"] // 2
-            )
-            screen.blit(surf, (p["x"], p["y"]))
-
     # ----------------- Helpers -----------------
     def _system_bar_position(self, rect):
         """Return a tuple for status bar under icon"""
@@ -2,15 +2,25 @@ import pygame
 import gif_pygame
 import random
 from game.core import BaseState, logger
-from game.ui import FadeTransition, Colors
+from game.ui import FadeTransition, Colors, AnimatedBackground
 from game.widgets import Button, TextLine
 from .states import States
 from game.utils import *
 
 
 class Menu(BaseState):
+    assets = (
+        "menu_bg_gif",
+        "menu_astronaut",
+        "button_click",
+    )
+    likely_next = (States.CREDITS,)
+
     def __init__(self, game=None):
         super().__init__(States.MENU, game)
+
+        # quality: number of decorative stars
+        self.stars_quality = self.game.quality.register("menu_stars", (0, 3, 6))
         self.fade_transition = FadeTransition(
             size=(self.game.width, self.game.height),
             starting_alpha=255,
@@ -18,20 +28,14 @@ class Menu(BaseState):
             speed=120,
         )
 
-        # Load background GIF
-        gif_path = resource_path("assets/gifs/menu_bg_gif.gif")
-        with open(gif_path, "rb") as f:
-            gif_bytes = f.read()
-        self.bg_gif = load_gif_from_bytes(gif_bytes)
-        self.bg_frame_index = 0
-        self.bg_frame_delay = 60  # ms per frame
-        self.bg_frame_timer = 0
+        # Background GIF (loaded in load_assets)
+        self.bg_gif = []
+        self.bg_frame_durations = []
+        self.bg_anim = None
         self.bg_gif_surf = None
 
-        # Load astronaut image
-        self.astronaut_img = pygame.image.load(
-            resource_path("assets/images/astronaut.png")
-        ).convert_alpha()
+        # Astronaut image (loaded in load_assets)
+        self.astronaut_img = None
 
         # Astronaut state
         self.astronaut_x = -200
@@ -39,7 +43,10 @@ class Menu(BaseState):
         self.astronaut_speed = 50
         self.astronaut_rotation = 0.0
         self.astronaut_rotation_speed = 30.0
-        self._spawn_astronaut()
+        self.astronaut_original = None
+        self.astronaut_rotations = RotationCache(
+            smooth=self.game.ss.get("smooth_rotation", False)
+        )
 
         # Title text
         self.title = TextLine(
@@ -76,9 +83,6 @@ class Menu(BaseState):
             hover_font_color=Colors.WHITE,
             clicked_color=Colors.DARK_CRIMSON,
             clicked_font_color=Colors.WHITE,
-            click_sound=pygame.Sound(
-                resource_path("assets/sound/sfx/button_click.mp3")
-            ),
             size_ratio=(0.25, 0.08),
             pos_ratio=(0.5, 0.0),
             screen_size=self.game.size,
@@ -128,9 +132,6 @@ class Menu(BaseState):
             hover_font_color=Colors.WHITE,
             clicked_color=Colors.DARK_CRIMSON,
             clicked_font_color=Colors.WHITE,
-            click_sound=pygame.Sound(
-                resource_path("assets/sound/sfx/button_click.mp3")
-            ),
             size_ratio=(0.25, 0.08),
             pos_ratio=(0.5, 0.0),
             screen_size=self.game.size,
@@ -147,8 +148,66 @@ class Menu(BaseState):
         # Pulsing effect for title
         self.pulse_timer = 0.0
         self.pulse_speed = 1.5
+        self.pulse_amount = 0.05
+
+        # pre-rendered title per font size (see warmup)
+        self._title_cache = {}
+        self._title_base_size = None
+
+    def load_assets(self):
+        assets = self.game.assets
+
+        self.bg_gif, self.bg_frame_durations = assets.gif("menu_bg_gif", self)
+        self.bg_anim = AnimatedBackground(self.bg_gif, self.bg_frame_durations)
+
+        self.astronaut_img = assets.image("menu_astronaut", self)
+
+        click_sound = assets.sound("button_click", self)
+        self.start_button.click_sound = click_sound
+        self.exit_button.click_sound = click_sound
+
+    def warmup(self):
+        """Pre-render every title size of the pulse and the first GIF frame."""
+        base_size = self.game.size_depended(8)
+        for size in range(
+            int(base_size), int(base_size * (1.0 + self.pulse_amount)) + 1
+        ):
+            self._render_title(size)
+        self.bg_anim.current(self.game.size)
+
+    def _render_title(self, size: int):
+        # window resized, the old sizes won't come back
+        base_size = self.game.size_depended(8)
+        if base_size != self._title_base_size:
+            self._title_cache.clear()
+            self._title_base_size = base_size
+
+        rendered = self._title_cache.get(size)
+        if rendered is None:
+            rendered = self.game.font.render("SPACE OLYMPICS", Colors.WHITE, size=size)
+            self._title_cache[size] = rendered
+        return rendered
+
+    def reacquire_assets(self):
+        super().reacquire_assets()
+        # scaled from the old surface, make it again where it is now
+        self.astronaut_original = None
+        self._scale_astronaut()
+
+    def unload_assets(self):
+        super().unload_assets()
+        self.bg_gif = []
+        self.bg_frame_durations = []
+        self.bg_anim = None
+        self.bg_gif_surf = None
+        self.astronaut_img = None
+        self.astronaut_original = None
+        self.astronaut_rotations.clear()
+        self.start_button.click_sound = None
+        self.exit_button.click_sound = None
 
     def startup(self):
+        super().startup()
         pygame.display.set_caption("Space Olympics - Menu")
         self.fade_transition.startup()
         for btn in self.buttons:
@@ -189,15 +248,23 @@ class Menu(BaseState):
         logger.info("Menu: Exiting game")
         self.game.quit_game()
 
-    def _spawn_astronaut(self):
+    def _scale_astronaut(self) -> int:
+        """Scale the astronaut to the window; returns its width."""
         astronaut_width = int(self.game.width * 0.12)
         astronaut_aspect = (
             self.astronaut_img.get_height() / self.astronaut_img.get_width()
         )
         astronaut_height = int(astronaut_width * astronaut_aspect)
-        self.astronaut_original = pygame.transform.scale(
-            self.astronaut_img, (astronaut_width, astronaut_height)
-        )
+        size = (astronaut_width, astronaut_height)
+        # rescale (and drop the rotated copies) only when the size changed
+        current = self.astronaut_original
+        if current is None or current.get_size() != size:
+            self.astronaut_original = pygame.transform.scale(self.astronaut_img, size)
+            self.astronaut_rotations.set_image(self.astronaut_original)
+        return astronaut_width
+
+    def _spawn_astronaut(self):
+        astronaut_width = self._scale_astronaut()
         self.astronaut_y = random.randint(
             int(self.game.height * 0.1), int(self.game.height * 0.9)
         )
@@ -212,23 +279,16 @@ class Menu(BaseState):
             btn.get_event(event)
 
     def draw(self, screen: pygame.Surface):
-        # Draw background GIF
-        if self.bg_gif_surf:
-            screen.blit(self.bg_gif_surf, (0, 0))
-
-        # Overlay
-        overlay = pygame.Surface(self.game.size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        screen.blit(overlay, (0, 0))
+        # Draw background GIF with a dark overlay
+        self.draw_background(screen, self.bg_gif_surf, overlay=(0, 0, 0, 100))
 
         # Title pulsing
-        pulse_scale = 1.0 + 0.05 * abs(
+        pulse_scale = 1.0 + self.pulse_amount * abs(
             pygame.math.Vector2(1, 0).rotate(self.pulse_timer * 360).x
         )
         title_size = int(self.game.size_depended(8) * pulse_scale)
-        title_surf, title_rect = self.game.font.render(
-            "SPACE OLYMPICS", Colors.WHITE, size=title_size
-        )
+        title_surf, title_rect = self._render_title(title_size)
+        title_rect = title_rect.copy()
         title_rect.centerx = self.game.width // 2
         title_rect.centery = int(self.game.height * 0.25)
         screen.blit(title_surf, title_rect)
@@ -250,9 +310,7 @@ class Menu(BaseState):
         self.fade_transition.draw(screen)
 
     def _draw_astronaut(self, screen: pygame.Surface):
-        rotated = pygame.transform.rotate(
-            self.astronaut_original, self.astronaut_rotation
-        )
+        rotated = self.astronaut_rotations.get(self.astronaut_rotation)
         rect = rotated.get_rect(center=(int(self.astronaut_x), int(self.astronaut_y)))
         screen.blit(rotated, rect)
 
@@ -266,7 +324,7 @@ class Menu(BaseState):
             (w * 0.1, h * 0.5),
             (w * 0.9, h * 0.5),
         ]
-        for i, (x, y) in enumerate(star_positions):
+        for i, (x, y) in enumerate(star_positions[: self.stars_quality.value]):
             star_phase = (self.pulse_timer + i * 0.2) % 1.0
             alpha = int(
                 150 + 105 * abs(pygame.math.Vector2(1, 0).rotate(star_phase * 360).x)
@@ -287,20 +345,17 @@ class Menu(BaseState):
             )
 
     def update(self, screen, dt):
-        # GIF update
-        self.bg_frame_timer += dt
-        if self.bg_frame_timer >= self.bg_frame_delay:
-            self.bg_frame_timer = 0
-            self.bg_frame_index = (self.bg_frame_index + 1) % len(self.bg_gif)
-        self.bg_gif_surf = pygame.transform.scale(
-            self.bg_gif[self.bg_frame_index], self.game.size
-        )
+        # Background GIF (dt is seconds)
+        self.bg_anim.update(dt)
+        self.bg_gif_surf = self.bg_anim.current(self.game.size)
 
-        # Text
-        self.title.update(self.game.size)
-        self.subtitle.update(self.game.size)
+        # Text & button layout, only after a resize
+        if self.layout_changed():
+            self.title.update(self.game.size)
+            self.subtitle.update(self.game.size)
+            self._update_button_positions()
 
-        # Buttons
+        # Buttons (hover)
         for btn in self.buttons:
             btn.update(self.game.size)
 
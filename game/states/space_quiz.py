@@ -1,16 +1,31 @@
 import pygame
-import random
 from game.core import BaseState, logger
-from game.ui import FadeTransition, Colors
-from game.utils import resource_path, load_gif_from_bytes, mid_pos
+from game.ui import FadeTransition, Colors, AnimatedBackground, tint
+from game.utils import resource_path, mid_pos
 from .states import States
 from game.widgets import Button, TextLine, MultiLine
+from game.entities import ParticleSystem
 
 
 class SpaceQuiz(BaseState):
+    assets = (
+        "space_quiz_bg_gif",
+        "quiz_correct",
+        "quiz_wrong",
+        "quiz_complete",
+        "win",
+        "button_click",
+    )
+    partial_redraw = True
+
     def __init__(self, game=None):
         super().__init__(States.SPACE_QUIZ, game)
 
+        # quality: particle count
+        self.particle_quality = self.game.quality.register(
+            "space_quiz_particles", (0.25, 0.5, 1.0)
+        )
+
         # Fade transition
         self.fade_transition = FadeTransition(
             size=(self.game.width, self.game.height),
@@ -20,13 +35,10 @@ class SpaceQuiz(BaseState):
         )
 
         # --- Background GIF ---
-        bg_gif_path = resource_path("assets/gifs/space_quiz_bg.gif")
-        with open(bg_gif_path, "rb") as f:
-            gif_bytes = f.read()
-        self.bg_gif = load_gif_from_bytes(gif_bytes)
-        self.bg_frame_index = 0
-        self.bg_frame_delay = 0.08
-        self.bg_frame_timer = 0
+        # (loaded in load_assets)
+        self.bg_gif = []
+        self.bg_frame_durations = []
+        self.bg_anim = None
         self.bg_gif_surf = None
 
         # --- Quiz Questions ---
@@ -76,6 +88,7 @@ class SpaceQuiz(BaseState):
         # Quiz state
         self.current_question = 0
         self.selected_answer = None
+        self._drawn_view = None  # what the last frame showed, for dirty rects
         self.show_feedback = False
         self.feedback_timer = 0.0
         self.feedback_duration = 1.5
@@ -84,7 +97,7 @@ class SpaceQuiz(BaseState):
         self._played_win_sound = False
 
         # Visual effects
-        self.particles = []
+        self.particles = ParticleSystem()
         self.glow_pulse = 0.0
         self.shake_intensity = 0.0
 
@@ -105,9 +118,6 @@ class SpaceQuiz(BaseState):
             hover_font_color=Colors.WHITE,
             clicked_color=Colors.ELECTRIC_BLUE,
             clicked_font_color=Colors.FROST_WHITE,
-            click_sound=pygame.Sound(
-                resource_path("assets/sound/sfx/button_click.mp3")
-            ),
             size_ratio=(0.25, 0.08),
             screen_size=self.game.size,
             border_radius=12,
@@ -115,27 +125,35 @@ class SpaceQuiz(BaseState):
             border_color=Colors.ICE_BLUE,
         )
 
+        # Question counter visual
+        self.progress_dots = []
+
+    def load_assets(self):
+        assets = self.game.assets
+
+        self.bg_gif, self.bg_frame_durations = assets.gif("space_quiz_bg_gif", self)
+        self.bg_anim = AnimatedBackground(self.bg_gif, self.bg_frame_durations)
+
+        self.next_button.click_sound = assets.sound("button_click", self)
+
         # Load sounds
         self._load_sounds()
 
-        # Question counter visual
-        self.progress_dots = []
+    def unload_assets(self):
+        super().unload_assets()
+        self.bg_gif = []
+        self.bg_frame_durations = []
+        self.bg_anim = None
+        self.bg_gif_surf = None
+        self.next_button.click_sound = None
 
     def _load_sounds(self):
         """Load quiz sounds"""
         try:
-            self.game.sound_manager.load_sound(
-                "quiz_correct", resource_path("assets/sound/sfx/quiz_correct.mp3")
-            )
-            self.game.sound_manager.load_sound(
-                "quiz_wrong", resource_path("assets/sound/sfx/quiz_wrong.mp3")
-            )
-            self.game.sound_manager.load_sound(
-                "quiz_complete", resource_path("assets/sound/sfx/quiz_complete.mp3")
-            )
-            self.game.sound_manager.load_sound(
-                "win", resource_path("assets/sound/sfx/win.mp3")
-            )
+            self.load_sound("quiz_correct", "quiz_correct")
+            self.load_sound("quiz_wrong", "quiz_wrong")
+            self.load_sound("quiz_complete", "quiz_complete")
+            self.load_sound("win", "win")
         except Exception as e:
             logger.warning(f"Could not load quiz sounds: {e}")
 
@@ -171,6 +189,7 @@ class SpaceQuiz(BaseState):
             self.answer_buttons.append(btn)
 
     def startup(self):
+        super().startup()
         pygame.display.set_caption("Space Knowledge Quiz")
         self.fade_transition.startup()
         self.next_button.startup()
@@ -181,12 +200,13 @@ class SpaceQuiz(BaseState):
         # Reset state
         self.current_question = 0
         self.selected_answer = None
+        self._drawn_view = None
         self.show_feedback = False
         self.feedback_timer = 0.0
         self.is_correct = False
         self.quiz_complete = False
         self._played_win_sound = False
-        self.particles = []
+        self.particles.clear()
         self.glow_pulse = 0.0
         self.shake_intensity = 0.0
 
@@ -218,25 +238,18 @@ class SpaceQuiz(BaseState):
         # Admin skip
         if event.type == pygame.KEYDOWN and self.game.admin:
             if event.key == pygame.K_d and (event.mod & pygame.KMOD_CTRL):
-                self.quiz_complete = True
+                self._complete_quiz()
 
     def update(self, screen, dt):
-        # Background GIF
-        self.bg_frame_timer += dt
-        if self.bg_frame_timer >= self.bg_frame_delay:
-            self.bg_frame_timer = 0.0
-            if self.bg_gif:
-                self.bg_frame_index = (self.bg_frame_index + 1) % len(self.bg_gif)
-
-        if self.bg_gif:
-            bg_frame = self.bg_gif[self.bg_frame_index]
-            try:
-                self.bg_gif_surf = pygame.transform.scale(bg_frame, self.game.size)
-            except Exception:
-                self.bg_gif_surf = None
+        # Background GIF (dt is seconds); the renderer backend composes it
+        # under the frame, so a new GIF frame doesn't change the frame there
+        if self.bg_anim.update(dt) and not self.game.renderer_backend:
+            self.mark_dirty()
+        self.bg_gif_surf = self.bg_anim.current(self.game.size)
 
         # Update particles
-        self._update_particles(dt)
+        with self.game.profiler.zone("particles.update"):
+            self.particles.update(dt)
 
         # Update glow pulse
         self.glow_pulse += dt * 2.0
@@ -256,11 +269,7 @@ class SpaceQuiz(BaseState):
                 if self.is_correct:
                     self.current_question += 1
                     if self.current_question >= len(self.questions):
-                        self.quiz_complete = True
-                        try:
-                            self.game.sound_manager.play_sound("quiz_complete")
-                        except:
-                            pass
+                        self._complete_quiz()
 
                 self.show_feedback = False
                 self.feedback_timer = 0.0
@@ -274,14 +283,10 @@ class SpaceQuiz(BaseState):
             self.next_button.update(self.game.size)
 
     def draw(self, screen: pygame.Surface):
-        # Background
-        if self.bg_gif_surf:
-            screen.blit(self.bg_gif_surf, (0, 0))
-
-        # Dark overlay
-        overlay = pygame.Surface(self.game.size, pygame.SRCALPHA)
-        overlay.fill((*Colors.DEEP_SPACE_BLUE, 150))
-        screen.blit(overlay, (0, 0))
+        # Background with a dark overlay
+        self.draw_background(
+            screen, self.bg_gif_surf, overlay=(*Colors.DEEP_SPACE_BLUE, 150)
+        )
 
         if not self.quiz_complete:
             # Draw progress dots
@@ -301,12 +306,45 @@ class SpaceQuiz(BaseState):
             self._draw_completion(screen)
 
         # Draw particles
-        self._draw_particles(screen)
+        with self.game.profiler.zone("particles.draw"):
+            self.particles.draw(screen)
 
         # Fade
         self.fade_transition.draw(screen)
 
-    def _draw_progress(self, screen):
+        # Dirty rects: only the dots and buttons change on a settled question,
+        # anything else (new question, feedback ending) repaints the screen
+        view = (
+            self.current_question,
+            self.show_feedback,
+            self.quiz_complete,
+            self.selected_answer,
+        )
+        button_rects = [btn.dirty_rect() for btn in self.answer_buttons]
+        if (
+            view != self._drawn_view
+            or self.show_feedback
+            or self.quiz_complete
+            or self.particles
+            or not self.fade_transition.is_done()
+        ):
+            self.mark_dirty()
+        self._drawn_view = view
+        for rect in button_rects:
+            if rect:
+                self.mark_dirty(rect)
+
+    def _complete_quiz(self):
+        self.quiz_complete = True
+        try:
+            self.game.sound_manager.play_sound("quiz_complete")
+        except:
+            pass
+        # confetti from the bottom of the screen
+        w, h = self.game.size
+        self.particles.emit(w // 2, h, "celebration", scale=self.particle_quality.value)
+
+
         """Draw progress dots showing current question"""
         w, h = self.game.size
         dot_size = int(min(w, h) * 0.015)
@@ -328,12 +366,13 @@ class SpaceQuiz(BaseState):
                     Colors.ICE_BLUE[1],
                     Colors.ICE_BLUE[2],
                 )
-                pygame.draw.circle(
+                glow_rect = pygame.draw.circle(
                     screen,
                     (*color, int(100 + 100 * pulse)),
                     (x + dot_size // 2, y),
                     dot_size + 4,
                 )
+                self.mark_dirty(glow_rect)
             else:
                 color = Colors.DEEP_PURPLE
 
@@ -357,36 +396,19 @@ class SpaceQuiz(BaseState):
         q_num_rect.top = int(h * 0.15)
         screen.blit(q_num_surf, q_num_rect)
 
-        # Question text with word wrap
-        question_text = question_data["question"]
-        max_width = int(w * 0.8)
-        words = question_text.split()
-        lines = []
-        current_line = []
-
-        for word in words:
-            test_line = " ".join(current_line + [word])
-            test_surf, test_rect = self.game.font.render(
-                test_line, Colors.WHITE, size=self.game.size_depended(22)
-            )
-            if test_rect.width <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-
-        if current_line:
-            lines.append(" ".join(current_line))
+        # Question text, wrapped and rendered once per layout
+        lines = self.game.text_layout.lines(
+            question_data["question"],
+            Colors.FROST_WHITE,
+            int(w * 0.8),
+            size=self.game.size_depended(22),
+        )
 
         # Draw question lines
         line_height = int(h * 0.05)
         start_y = int(h * 0.25)
 
-        for i, line in enumerate(lines):
-            line_surf, line_rect = self.game.font.render(
-                line, Colors.FROST_WHITE, size=self.game.size_depended(22)
-            )
+        for i, (line_surf, line_rect) in enumerate(lines):
             line_rect.centerx = w // 2
             line_rect.top = start_y + i * line_height
             screen.blit(line_surf, line_rect)
@@ -421,68 +443,41 @@ class SpaceQuiz(BaseState):
             # Draw button
             self.answer_buttons[i].draw(screen)
 
-            # Draw option text
-            text_x = int(w * 0.18)
-            text_surf, text_rect = self.game.font.render(
-                option, Colors.FROST_WHITE, size=self.game.size_depended(26)
+            # Draw option text (wrapped if too long)
+            lines = self.game.text_layout.lines(
+                option,
+                Colors.FROST_WHITE,
+                int(w * 0.65),
+                size=self.game.size_depended(26),
             )
-            text_rect.left = text_x
-            text_rect.centery = y_pos + self.answer_buttons[i].rect.height // 2 - 30
-
-            # Word wrap if too long
-            if text_rect.width > w * 0.65:
-                words = option.split()
-                lines = []
-                current_line = []
-                max_width = int(w * 0.65)
-
-                for word in words:
-                    test_line = " ".join(current_line + [word])
-                    test_surf, test_rect = self.game.font.render(
-                        test_line, Colors.FROST_WHITE, size=self.game.size_depended(26)
-                    )
-                    if test_rect.width <= max_width:
-                        current_line.append(word)
-                    else:
-                        if current_line:
-                            lines.append(" ".join(current_line))
-                        current_line = [word]
-
-                if current_line:
-                    lines.append(" ".join(current_line))
-
-                # Draw wrapped lines
-                line_offset = 0
-                for line in lines:
-                    line_surf, line_rect = self.game.font.render(
-                        line, Colors.FROST_WHITE, size=self.game.size_depended(26)
-                    )
-                    line_rect.left = text_x
-                    line_rect.top = text_rect.top + line_offset
-                    screen.blit(line_surf, line_rect)
-                    line_offset += line_rect.height + 5
-            else:
-                screen.blit(text_surf, text_rect)
+            if not lines:
+                continue
+            first_rect = lines[0][1]
+            first_rect.centery = y_pos + self.answer_buttons[i].rect.height // 2 - 30
+            line_top = first_rect.top
+
+            for line_surf, line_rect in lines:
+                line_rect.left = int(w * 0.18)
+                line_rect.top = line_top
+                screen.blit(line_surf, line_rect)
+                line_top += line_rect.height + 5
 
     def _draw_feedback(self, screen):
         """Draw feedback message"""
         w, h = self.game.size
 
-        # Create semi-transparent overlay
-        feedback_overlay = pygame.Surface((w, int(h * 0.15)), pygame.SRCALPHA)
-
         if self.is_correct:
-            feedback_overlay.fill((*Colors.ELECTRIC_BLUE, 200))
+            overlay_color = (*Colors.ELECTRIC_BLUE, 200)
             text = "CORRECT!"
             color = Colors.FROST_WHITE
         else:
-            feedback_overlay.fill((*Colors.CRITICAL_RED, 200))
+            overlay_color = (*Colors.CRITICAL_RED, 200)
             text = "INCORRECT - TRY AGAIN"
             color = Colors.WHITE
 
-        # Draw overlay
+        # Draw semi-transparent overlay
         overlay_y = int(h * 0.85)
-        screen.blit(feedback_overlay, (0, overlay_y))
+        tint(screen, overlay_color, (0, overlay_y, w, int(h * 0.15)))
 
         # Draw border
         border_color = Colors.ELECTRIC_BLUE if self.is_correct else Colors.CRITICAL_RED
@@ -500,9 +495,7 @@ class SpaceQuiz(BaseState):
         w, h = self.game.size
 
         # Overlay
-        overlay = pygame.Surface(self.game.size, pygame.SRCALPHA)
-        overlay.fill((*Colors.DEEP_SPACE_BLUE, 220))
-        screen.blit(overlay, (0, 0))
+        tint(screen, (*Colors.DEEP_SPACE_BLUE, 220))
 
         # Play win sound once
         if not self._played_win_sound:
@@ -552,7 +545,10 @@ class SpaceQuiz(BaseState):
             except:
                 pass
             # Spawn success particles
-            self._spawn_success_particles()
+            w, h = self.game.size
+            self.particles.emit(
+                w // 2, h // 2, "success", scale=self.particle_quality.value
+            )
         else:
             try:
                 self.game.sound_manager.play_sound("quiz_wrong")
@@ -560,48 +556,3 @@ class SpaceQuiz(BaseState):
                 pass
             # Shake effect
             self.shake_intensity = 5.0
-
-    def _spawn_success_particles(self):
-        """Spawn particles for correct answer"""
-        w, h = self.game.size
-        center_x = w // 2
-        center_y = h // 2
-
-        for _ in range(30):
-            angle = random.uniform(0, 360)
-            speed = random.uniform(50, 150)
-            self.particles.append(
-                {
-                    "x": center_x,
-                    "y": center_y,
-                    "vx": speed * pygame.math.Vector2(1, 0).rotate(angle).x,
-                    "vy": speed * pygame.math.Vector2(1, 0).rotate(angle).y,
-                    "life": random.uniform(0.5, 1.2),
-                    "color": random.choice(
-                        [Colors.ELECTRIC_BLUE, Colors.ICE_BLUE, Colors.FROST_WHITE]
-                    ),
-                    "size": random.randint(3, 8),
-                }
-            )
-
-    def _update_particles(self, dt):
-        """Update particle positions and lifetime"""
-        new_particles = []
-        for p in self.particles:
-            p["x"] += p["vx"] * dt
-            p["y"] += p["vy"] * dt
-            p["life"] -= dt
-            if p["life"] > 0:
-                new_particles.append(p)
-        self.particles = new_particles
-
-    def _draw_particles(self, screen):
-        """Draw particles with fade"""
-        for p in self.particles:
-            alpha = int(255 * (p["life"] / 1.2))
-            surf = pygame.Surface((p["size"], p["size"]), pygame.SRCALPHA)
-            color = (*p["color"], alpha)
-            pygame.draw.circle(
-                surf, color, (p["size"] // 2, p["size"] // 2), p["size"] // 2
-            )
-            screen.blit(surf, (int(p["x"]), int(p["y"])))
@@ -1,11 +1,22 @@
+import time
+from typing import Callable, List, Sequence, Tuple
+
 from game.core import BaseState, logger
 import pygame
 from .states import States
 from game.utils import clamp_alpha, mid_pos
-from game.ui import FadeTransition, Colors
+from game.ui import FadeTransition, Colors, tint
 
 
 class SplashScreen(BaseState):
+    """Intro screen that doubles as the preloader of the first states.
+
+    While the text animates, the assets of ``critical_states`` are acquired
+    a few per frame (decoding runs on the prefetch worker), then each state
+    runs its ``load_assets`` and ``warmup``. The splash hands off only when
+    that work is done and ``min_display_time`` has passed.
+    """
+
     def __init__(
         self,
         game=None,
@@ -19,6 +30,9 @@ class SplashScreen(BaseState):
         next_state=States.MENU,
         text_fade: FadeTransition | None = None,
         screen_fade: FadeTransition | None = None,
+        critical_states: Sequence[str] | None = None,
+        min_display_time: float = 2.0,
+        frame_budget: float = 0.006,
     ):
         super().__init__(States.SPLASH_SCREEN, game)
 
@@ -31,6 +45,9 @@ class SplashScreen(BaseState):
         self.bg_color = bg_color
         self.fade_color = fade_color
         self.next_state = next_state
+        self.critical_states = tuple(critical_states or (next_state,))
+        self.min_display_time = min_display_time  # seconds
+        self.frame_budget = frame_budget  # seconds of loading work per frame
 
         # original params
         self.orig_base_font_ratio = base_font_ratio
@@ -42,13 +59,63 @@ class SplashScreen(BaseState):
             color=self.fade_color,
         )
 
+        # loading queue of (is_ready, run)
+        self.tasks: List[Tuple[Callable[[], bool], Callable[[], None]]] = []
+        self.tasks_total = 0
+
     def startup(self):
+        super().startup()
         pygame.display.set_caption(self.text)
 
         # reset for each run
         self.text_transition.startup()
         self.fade_transition.startup()
         self.base_font_ratio = self.orig_base_font_ratio
+        self._queue_tasks()
+
+    # --- preloading ---
+    def _queue_tasks(self):
+        assets = self.game.assets
+        self.tasks = []
+
+        for state in self.game.states:
+            if state.name not in self.critical_states or state.assets_loaded:
+                continue
+
+            # decode on the worker, acquire on the main thread once it's done
+            assets.prefetch(state.assets)
+            for key in state.assets:
+                self.tasks.append(
+                    (
+                        lambda key=key: assets.is_ready(key),
+                        lambda key=key, state=state: assets.load(key, state),
+                    )
+                )
+
+            # everything is resident by now, these only wire it up
+            self.tasks.append((lambda: True, state.ensure_assets))
+            self.tasks.append((lambda: True, state.warmup))
+
+        self.tasks_total = len(self.tasks)
+
+    def _run_tasks(self):
+        deadline = time.perf_counter() + self.frame_budget
+        while self.tasks and time.perf_counter() < deadline:
+            is_ready, run = self.tasks[0]
+            if not is_ready():
+                break  # still decoding, keep animating
+            run()
+            self.tasks.pop(0)
+
+    @property
+    def progress(self) -> float:
+        if not self.tasks_total:
+            return 1.0
+        return 1.0 - len(self.tasks) / self.tasks_total
+
+    @property
+    def is_loaded(self) -> bool:
+        return not self.tasks
 
     def cleanup(self):
         pass
@@ -60,20 +127,41 @@ class SplashScreen(BaseState):
         # background
         screen.fill(self.bg_color)
 
-        # text size & rendering
-        text_size = min(self.game.width, self.game.height) // self.base_font_ratio
+        # text size & rendering; whole sizes only, so the cache gets hits
+        text_size = int(min(self.game.width, self.game.height) / self.base_font_ratio)
 
+        # the surface is shared by the text cache: fade it with a background
+        # tint on the screen instead of set_alpha
         text_surf, text_rect = self.font.render(
             self.text, self.font_color, size=text_size
         )
-        text_surf.set_alpha(self.text_transition.alpha)
-
-        screen.blit(text_surf, mid_pos(self.game.size, text_rect))
+        text_rect = screen.blit(text_surf, mid_pos(self.game.size, text_rect))
+        fade = 255 - clamp_alpha(self.text_transition.alpha)
+        tint(screen, (*self.bg_color[:3], fade), text_rect)
 
         # black overlay fade
         self.fade_transition.draw(screen)
 
+        # loading bar, on top so it stays visible once the fade is black
+        if self.tasks_total:
+            self._draw_progress(screen)
+
+    def _draw_progress(self, screen: pygame.Surface):
+        w, h = self.game.size
+        bar_w = int(w * 0.3)
+        bar_h = max(4, int(h * 0.01))
+        bar_rect = pygame.Rect((w - bar_w) // 2, int(h * 0.85), bar_w, bar_h)
+
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_w * self.progress)
+
+        pygame.draw.rect(screen, Colors.KHAKI, fill_rect)
+        pygame.draw.rect(screen, Colors.GRAY, bar_rect, 1)
+
     def update(self, screen: pygame.Surface, dt: float):
+        # preload the first states
+        self._run_tasks()
+
         # update text fade animation
         self.text_transition.update(dt)
         self.base_font_ratio += self.sizing_speed * dt
@@ -82,7 +170,11 @@ class SplashScreen(BaseState):
         self.fade_transition.set_size(self.game.size)
         self.fade_transition.update(dt)
 
-        # switch state when animation ends
-        if self.fade_transition.is_done():
+        # switch state when animation ends and the critical set is resident
+        if (
+            self.fade_transition.is_done()
+            and self.is_loaded
+            and self.game.time_since_last_state >= self.min_display_time
+        ):
             logger.debug("Splash screen fade animation ended.")
             self.game.sm.set_state(self.next_state)
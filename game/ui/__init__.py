@@ -1,2 +1,6 @@
 from .fade_transition import FadeTransition
 from .colors import Colors
+from .animated_background import AnimatedBackground
+from .overlay import tint
+from .text_layout import TextLayout
+from .easing import Easing
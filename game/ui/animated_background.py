@@ -0,0 +1,77 @@
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+import pygame
+
+from game.utils import DEFAULT_FRAME_DURATION
+
+
+class AnimatedBackground:
+    """GIF frames played at their own durations, scaled to the window.
+
+    Playback time is kept modulo the loop length instead of resetting a
+    timer, so leftover time carries over and the animation never drifts from
+    wall time. Scaled frames are cached until the window size changes.
+    """
+
+    def __init__(
+        self,
+        frames: List[pygame.Surface],
+        durations: Optional[List[int]] = None,
+        speed: float = 1.0,
+    ):
+        self.frames = frames
+        self.speed = speed
+
+        # frame end times in seconds, for a bisect lookup of the current frame
+        durations = durations or [DEFAULT_FRAME_DURATION] * len(frames)
+        self._ends = list(accumulate(d / 1000 for d in durations))
+        self.length = self._ends[-1] if self._ends else 0.0
+        self.elapsed = 0.0
+
+        self._scaled: Dict[int, pygame.Surface] = {}
+        self._scaled_size: Optional[Tuple[int, int]] = None
+
+    def __len__(self):
+        return len(self.frames)
+
+    # --- playback ---
+    def update(self, dt: float) -> bool:
+        """Advance by ``dt`` seconds; True if another frame is now showing."""
+        if not self.length:
+            return False
+        index = self.index
+        self.elapsed = (self.elapsed + dt * self.speed) % self.length
+        return self.index != index
+
+    def reset(self):
+        self.elapsed = 0.0
+
+    @property
+    def index(self) -> int:
+        return min(bisect_right(self._ends, self.elapsed), len(self.frames) - 1)
+
+    def current(self, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """Return the frame for the current time scaled to ``size``."""
+        return self.frame(self.index, size)
+
+    # --- scaling ---
+    def frame(self, index: int, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """Return frame ``index`` scaled to ``size``, scaling it at most once."""
+        if not self.frames:
+            return None
+
+        # window size changed (e.g. fullscreen toggle), drop the old scales
+        if size != self._scaled_size:
+            self._scaled.clear()
+            self._scaled_size = size
+
+        surf = self._scaled.get(index)
+        if surf is None:
+            surf = pygame.transform.scale(self.frames[index], size)
+            self._scaled[index] = surf
+        return surf
+
+    def invalidate(self):
+        self._scaled.clear()
+        self._scaled_size = None
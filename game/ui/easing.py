@@ -0,0 +1,29 @@
+import math
+
+
+class Easing:
+    """Easing curves: map progress ``t`` in [0, 1] to eased progress."""
+
+    @staticmethod
+    def linear(t: float) -> float:
+        return t
+
+    @staticmethod
+    def in_quad(t: float) -> float:
+        return t * t
+
+    @staticmethod
+    def out_quad(t: float) -> float:
+        return t * (2 - t)
+
+    @staticmethod
+    def in_out_quad(t: float) -> float:
+        return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+    @staticmethod
+    def in_out_sine(t: float) -> float:
+        return -(math.cos(math.pi * t) - 1) / 2
+
+    @staticmethod
+    def smoothstep(t: float) -> float:
+        return t * t * (3 - 2 * t)
@@ -1,9 +1,16 @@
-from typing import Tuple
+from typing import Callable, Optional, Tuple
 import pygame
 from game.utils import clamp_alpha
 
 
 class FadeTransition:
+    """Full-color overlay fading from ``starting_alpha`` to ``ending_alpha``.
+
+    One surface is kept per size and color, and only its alpha changes; at
+    alpha 0 nothing is drawn. ``easing`` (see ``Easing``) shapes the fade; it
+    is baked into a 256 entry table up front, so easing costs a lookup.
+    """
+
     def __init__(
         self,
         size: Tuple[int, int] = (0, 0),
@@ -12,36 +19,72 @@ class FadeTransition:
         ending_alpha: int = 255,
         pos: Tuple[int, int] = (0, 0),
         speed: int = 100,
+        easing: Optional[Callable[[float], float]] = None,
     ):
         self.size = size
         self.color = color
         self.starting_alpha = clamp_alpha(starting_alpha)
         self.ending_alpha = clamp_alpha(ending_alpha)
-        self.alpha = self.starting_alpha  # changing alpha
         self.pos = pos
         self.speed = speed
         self.done = False
 
+        self._eased = self._easing_table(easing)
+        self._linear = self.starting_alpha  # alpha before easing
+        self.alpha = self.starting_alpha  # changing alpha
+
+        self._surf: Optional[pygame.Surface] = None
+        self._surf_alpha = None
+
+    def _easing_table(self, easing) -> Optional[Tuple[int, ...]]:
+        """Eased alpha for every linear alpha on the way from start to end."""
+        start, end = self.starting_alpha, self.ending_alpha
+        if easing is None or start == end:
+            return None
+        table = list(range(256))
+        low, high = min(start, end), max(start, end)
+        for value in range(low, high + 1):
+            t = (value - start) / (end - start)
+            table[value] = clamp_alpha(round(start + (end - start) * easing(t)))
+        return tuple(table)
+
     def startup(self):
-        self.alpha = self.starting_alpha
+        self._linear = self.alpha = self.starting_alpha
         self.done = False
 
     def draw(self, screen: pygame.Surface):
-        fade_surf = pygame.Surface(self.size, pygame.SRCALPHA)
-        fade_surf.fill((*self.color, self.alpha))
-        screen.blit(fade_surf, self.pos)
+        alpha = self.alpha
+        if alpha <= 0:
+            return
+        if alpha >= 255:
+            screen.fill(self.color, (self.pos, self.size))
+            return
+
+        surf = self._surf
+        if surf is None or surf.get_size() != tuple(self.size):
+            surf = pygame.Surface(self.size)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert()
+            surf.fill(self.color)
+            self._surf = surf
+            self._surf_alpha = None
+        if alpha != self._surf_alpha:
+            surf.set_alpha(alpha)
+            self._surf_alpha = alpha
+        screen.blit(surf, self.pos)
 
     def update(self, dt):
         if self.starting_alpha > self.ending_alpha:
-            self.alpha -= max(1, self.speed * dt)
+            self._linear -= max(1, self.speed * dt)
         elif self.starting_alpha < self.ending_alpha:
-            self.alpha += max(1, self.speed * dt)
+            self._linear += max(1, self.speed * dt)
 
         # clamp alpha
-        self.alpha = clamp_alpha(self.alpha)
+        self._linear = clamp_alpha(self._linear)
+        self.alpha = self._eased[self._linear] if self._eased else self._linear
 
         # animation ended, return True
-        if self.alpha == self.ending_alpha:
+        if self._linear == self.ending_alpha:
             self.done = True
 
     def is_done(self):
@@ -49,3 +92,7 @@ class FadeTransition:
 
     def set_size(self, new_size: Tuple[int, int]):
         self.size = new_size
+
+    def set_color(self, color: Tuple[int, int, int]):
+        self.color = color
+        self._surf = None  # refilled on the next draw
@@ -0,0 +1,55 @@
+from typing import Optional, Tuple
+import pygame
+
+_layer_surf: Optional[pygame.Surface] = None
+
+
+def _layer(color: Tuple[int, int, int, int], size: Tuple[int, int]) -> pygame.Surface:
+    """A reused SRCALPHA surface of ``size`` filled with ``color``."""
+    global _layer_surf
+    surf = _layer_surf
+    if surf is None or surf.get_width() < size[0] or surf.get_height() < size[1]:
+        w, h = size
+        if surf is not None:
+            w, h = max(w, surf.get_width()), max(h, surf.get_height())
+        surf = _layer_surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    layer = surf.subsurface((0, 0, *size))
+    layer.fill(color)
+    return layer
+
+
+def tint(
+    surface: pygame.Surface,
+    color: Tuple[int, ...],
+    rect: Optional[pygame.Rect] = None,
+) -> pygame.Rect:
+    """Blend an RGBA ``color`` over ``rect`` of ``surface`` in place.
+
+    Looks the same as blitting a filled SRCALPHA surface, but allocates
+    nothing: the area is scaled by ``1 - alpha`` with a multiply fill and the
+    premultiplied color is added on top. Surfaces with per-pixel alpha get a
+    blit of one reused layer instead. Returns the affected rect.
+    """
+    r, g, b, a = color if len(color) == 4 else (*color, 255)
+    a = int(a)
+    rect = surface.get_rect() if rect is None else pygame.Rect(rect)
+
+    if a <= 0:
+        return rect
+    if a >= 255:
+        return surface.fill((r, g, b), rect)
+    if surface.get_flags() & pygame.SRCALPHA:
+        # translucent pixels (the renderer backend's frame) need their alpha
+        # raised as well, which only an alpha blit does
+        rect = rect.clip(surface.get_rect())
+        return surface.blit(_layer((r, g, b, a), rect.size), rect)
+
+    keep = 255 - a
+    affected = surface.fill((keep, keep, keep), rect, special_flags=pygame.BLEND_MULT)
+    if r or g or b:
+        surface.fill(
+            (r * a // 255, g * a // 255, b * a // 255),
+            rect,
+            special_flags=pygame.BLEND_ADD,
+        )
+    return affected
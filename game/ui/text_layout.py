@@ -0,0 +1,144 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Tuple
+
+import pygame
+import pygame.freetype
+
+
+class TextLayout:
+    """Word wrap measured with glyph metrics, with the rendered result cached.
+
+    ``font`` is the game's ``TextCache`` (anything with a ``font(size)``
+    returning a ``pygame.freetype.Font`` works). Wrapping sums cached word
+    widths from ``get_rect``, so nothing is rendered until the final lines,
+    and those are kept per (text, color, width, size, style).
+    """
+
+    def __init__(self, font, max_entries: int = 256):
+        self.font = font
+        self.max_entries = max_entries
+        self._layouts: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._word_widths: Dict[Tuple, int] = {}
+
+    # --- measuring ---
+    def measure(
+        self,
+        word: str,
+        size: float = 0,
+        style: int = pygame.freetype.STYLE_DEFAULT,
+    ) -> int:
+        key = (word, size, style)
+        width = self._word_widths.get(key)
+        if width is None:
+            font = self.font.font(size)
+            if word == " ":
+                # whitespace has no bounding box, use its advance
+                width = int(font.get_metrics(" ")[0][4])
+            else:
+                width = font.get_rect(word, style=style).width
+            self._word_widths[key] = width
+        return width
+
+    def wrap(
+        self,
+        text: str,
+        max_width: int,
+        size: float = 0,
+        style: int = pygame.freetype.STYLE_DEFAULT,
+    ) -> List[str]:
+        """Greedy word wrap of ``text`` to ``max_width`` pixels."""
+        space = self.measure(" ", size, style)
+        lines = []
+        line: List[str] = []
+        line_width = 0
+
+        for word in text.split():
+            word_width = self.measure(word, size, style)
+            new_width = line_width + space + word_width if line else word_width
+            if line and new_width > max_width:
+                lines.append(" ".join(line))
+                line, new_width = [], word_width
+            line.append(word)
+            line_width = new_width
+
+        if line:
+            lines.append(" ".join(line))
+        return lines
+
+    # --- rendering ---
+    def lines(
+        self,
+        text: str,
+        color,
+        max_width: int,
+        size: float = 0,
+        style: int = pygame.freetype.STYLE_DEFAULT,
+    ) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Rendered wrapped lines as ``(surface, rect)``; rects are copies."""
+        key = ("lines", text, tuple(color), max_width, size, style)
+        rendered = self._get(key)
+        if rendered is None:
+            font = self.font.font(size)
+            rendered = [
+                font.render(line, color, style=style)
+                for line in self.wrap(text, max_width, size, style)
+            ]
+            self._put(key, rendered)
+        return [(surf, rect.copy()) for surf, rect in rendered]
+
+    def block(
+        self,
+        text: str,
+        color,
+        max_width: int,
+        size: float = 0,
+        style: int = pygame.freetype.STYLE_DEFAULT,
+        line_spacing: int = 0,
+        center: bool = True,
+    ) -> Tuple[pygame.Surface, pygame.Rect]:
+        """The wrapped lines of ``text`` stacked on one surface."""
+        key = (
+            "block",
+            text,
+            tuple(color),
+            max_width,
+            size,
+            style,
+            line_spacing,
+            center,
+        )
+        rendered = self._get(key)
+        if rendered is None:
+            lines = self.lines(text, color, max_width, size, style)
+            width = max((surf.get_width() for surf, _ in lines), default=0)
+            height = sum(surf.get_height() for surf, _ in lines)
+            height += line_spacing * max(0, len(lines) - 1)
+
+            surf = pygame.Surface((width, height), pygame.SRCALPHA)
+            y = 0
+            for line_surf, _ in lines:
+                x = (width - line_surf.get_width()) // 2 if center else 0
+                surf.blit(line_surf, (x, y))
+                y += line_surf.get_height() + line_spacing
+
+            rendered = (surf, surf.get_rect())
+            self._put(key, rendered)
+
+        surf, rect = rendered
+        return surf, rect.copy()
+
+    # --- cache ---
+    def _get(self, key):
+        rendered = self._layouts.get(key)
+        if rendered is not None:
+            self._layouts.move_to_end(key)
+        return rendered
+
+    def _put(self, key, rendered):
+        self._layouts[key] = rendered
+        if len(self._layouts) > self.max_entries:
+            self._layouts.popitem(last=False)
+
+    def clear(self):
+        self._layouts.clear()
+        self._word_widths.clear()
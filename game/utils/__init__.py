@@ -1,3 +1,6 @@
 from .systems_utils import *
 from .pygame_utils import *
 from .animation_utils import *
+from .gif_cache import *
+from .surface_format import *
+from .rotation_cache import *
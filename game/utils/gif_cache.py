@@ -0,0 +1,179 @@
+import hashlib
+import mmap
+import os
+import struct
+from io import BytesIO
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pygame
+from PIL import Image
+
+# cache files live next to settings.json so they survive between launches
+GIF_CACHE_DIR = Path("data") / "cache" / "gifs"
+
+# file layout: header | durations (uint32 ms per frame) | raw RGBA frames
+CACHE_MAGIC = b"SPGC"
+CACHE_VERSION = 2
+_HEADER = struct.Struct("<4sHHIII")  # magic, version, flags, w, h, frame count
+FLAG_ALPHA = 1
+
+DEFAULT_FRAME_DURATION = 100  # ms, what browsers use for 0/missing durations
+
+
+def gif_digest(byte_data: bytes) -> str:
+    """Content hash used as the cache key of a GIF."""
+    return hashlib.sha1(byte_data).hexdigest()
+
+
+def decode_gif(
+    byte_data: bytes,
+) -> Tuple[Tuple[int, int], List[bytes], List[int], bool]:
+    """Decode every GIF frame to raw RGBA bytes with PIL.
+
+    Returns ``(size, frames, durations, has_alpha)`` where durations are in
+    milliseconds and ``has_alpha`` tells if any pixel is not fully opaque.
+    """
+    img = Image.open(BytesIO(byte_data))
+    frames = []
+    durations = []
+    has_alpha = False
+
+    try:
+        while True:
+            frame = img.convert("RGBA")
+            if not has_alpha:
+                has_alpha = frame.getextrema()[3][0] < 255
+            frames.append(frame.tobytes())
+            duration = int(img.info.get("duration", 0) or 0)
+            durations.append(duration if duration > 10 else DEFAULT_FRAME_DURATION)
+            img.seek(img.tell() + 1)
+    except EOFError:
+        pass
+
+    return img.size, frames, durations, has_alpha
+
+
+def write_gif_cache(
+    path: Path,
+    size: Tuple[int, int],
+    frames: List[bytes],
+    durations: List[int],
+    has_alpha: bool = True,
+):
+    """Write decoded frames to ``path`` atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    flags = FLAG_ALPHA if has_alpha else 0
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, flags, *size, len(frames)))
+        f.write(struct.pack(f"<{len(durations)}I", *durations))
+        for frame in frames:
+            f.write(frame)
+    os.replace(tmp_path, path)
+
+
+def read_gif_cache(
+    path: Path,
+) -> Optional[Tuple[Tuple[int, int], List[memoryview], List[int], bool]]:
+    """Memory-map a cache file and return ``(size, frames, durations, has_alpha)``.
+
+    Frames are views into the mapping, nothing is copied; the mapping is
+    released with the last view. Returns ``None`` when the file is missing,
+    truncated or from another version.
+    """
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    cached = _parse_gif_cache(mm)
+    if cached is None:
+        mm.close()
+    return cached
+
+
+def _parse_gif_cache(mm: mmap.mmap):
+    if len(mm) < _HEADER.size:
+        return None
+    magic, version, flags, w, h, count = _HEADER.unpack_from(mm, 0)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        return None
+
+    frame_len = w * h * 4
+    offset = _HEADER.size + count * 4
+    if len(mm) != offset + count * frame_len:
+        return None
+
+    durations = list(struct.unpack_from(f"<{count}I", mm, _HEADER.size))
+    view = memoryview(mm)
+    frames = [
+        view[offset + i * frame_len : offset + (i + 1) * frame_len]
+        for i in range(count)
+    ]
+    return (w, h), frames, durations, bool(flags & FLAG_ALPHA)
+
+
+def read_gif_raw(
+    path: str, cache_dir: Optional[Path] = GIF_CACHE_DIR
+) -> Tuple[Tuple[int, int], list, List[int], bool]:
+    """Load a GIF as raw ``(size, frames, durations_ms, has_alpha)`` via the cache.
+
+    The first launch decodes with PIL and writes the cache; later launches
+    map the cache file and skip PIL entirely. Pass ``cache_dir=None`` to
+    bypass the cache. Touches no pygame state, so it is safe on worker threads.
+    """
+    with open(path, "rb") as f:
+        byte_data = f.read()
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = Path(cache_dir) / f"{gif_digest(byte_data)}.rgba"
+        cached = read_gif_cache(cache_path)
+        if cached is not None:
+            return cached
+
+    size, frames, durations, has_alpha = decode_gif(byte_data)
+
+    if cache_path is not None:
+        try:
+            write_gif_cache(cache_path, size, frames, durations, has_alpha)
+        except OSError as e:
+            print(f"Warning: Could not write GIF cache {cache_path}: {e}")
+
+    return size, frames, durations, has_alpha
+
+
+def read_gif_bytes(
+    path: str, cache_dir: Optional[Path] = GIF_CACHE_DIR
+) -> Tuple[Tuple[int, int], List[bytes], List[int], bool]:
+    """``read_gif_raw`` with plain bytes frames, for sending across processes."""
+    size, frames, durations, has_alpha = read_gif_raw(path, cache_dir)
+    return size, [bytes(frame) for frame in frames], durations, has_alpha
+
+
+def frames_from_raw(
+    size: Tuple[int, int], frames: list, has_alpha: bool = True, convert: bool = True
+) -> list:
+    """Build surfaces from raw RGBA frames.
+
+    Each frame is wrapped with ``frombuffer`` (no copy) and converted once to
+    the display format, which is the only copy made. ``convert=False`` keeps
+    the wrapped surfaces, which then share memory with ``frames``.
+    """
+    surfaces = []
+    for raw in frames:
+        surf = pygame.image.frombuffer(raw, size, "RGBA")
+        if convert:
+            surf = surf.convert_alpha() if has_alpha else surf.convert()
+        surfaces.append(surf)
+    return surfaces
+
+
+def load_gif(
+    path: str, cache_dir: Optional[Path] = GIF_CACHE_DIR
+) -> Tuple[list, List[int]]:
+    """Load a GIF as ``(frames, durations_ms)`` surfaces through the frame cache."""
+    size, frames, durations, has_alpha = read_gif_raw(path, cache_dir)
+    return frames_from_raw(size, frames, has_alpha), durations
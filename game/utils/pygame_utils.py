@@ -1,14 +1,14 @@
 import pygame
 from pathlib import Path
 from typing import Tuple
-from PIL import Image
-from io import BytesIO
+from .gif_cache import decode_gif, frames_from_raw
+from .surface_format import to_display_format
 
 
-def load_sprite(path: str):
+def load_sprite(path: str, kind: str = None):
     p = Path(path)
     if p.exists():
-        return pygame.image.load(path).convert_alpha()
+        return to_display_format(pygame.image.load(path), kind)
     else:
         print(f"Warning: Sprite not found: {path}")
         return None
@@ -21,17 +21,40 @@ def mid_pos(screen_size: Tuple[int, int], rect: pygame.Rect) -> Tuple[int, int]:
     )
 
 
+# size the game renders at when it is not the window's (see BaseGame.screen)
+_render_size = None
+
+
+def set_render_size(size: Tuple[int, int] = None):
+    """Tell ``to_render_pos`` the offscreen render size, None when unscaled."""
+    global _render_size
+    _render_size = size
+
+
+def to_render_pos(pos: Tuple[int, int]) -> Tuple[int, int]:
+    """Map a window position (mouse, events) to render surface coordinates."""
+    display = pygame.display.get_surface()
+    if _render_size is None or display is None:
+        return pos
+    dw, dh = display.get_size()
+    return (pos[0] * _render_size[0] // dw, pos[1] * _render_size[1] // dh)
+
+
+def to_render_rel(rel: Tuple[int, int]) -> Tuple[int, int]:
+    """Scale a relative motion (``MOUSEMOTION.rel``) like ``to_render_pos``."""
+    display = pygame.display.get_surface()
+    if _render_size is None or display is None:
+        return rel
+    dw, dh = display.get_size()
+    # rounded, so small moves left/up aren't floored to a bigger step
+    return (round(rel[0] * _render_size[0] / dw), round(rel[1] * _render_size[1] / dh))
+
+
+def mouse_pos() -> Tuple[int, int]:
+    """``pygame.mouse.get_pos()`` in render surface coordinates."""
+    return to_render_pos(pygame.mouse.get_pos())
+
+
 def load_gif_from_bytes(byte_data):
-    img = Image.open(BytesIO(byte_data))
-    frames = []
-
-    try:
-        while True:
-            frame = img.copy().convert("RGBA")
-            pygame_image = pygame.image.fromstring(frame.tobytes(), frame.size, "RGBA")
-            frames.append(pygame_image)
-            img.seek(img.tell() + 1)
-    except EOFError:
-        pass
-
-    return frames
+    size, raw_frames, _, has_alpha = decode_gif(byte_data)
+    return frames_from_raw(size, raw_frames, has_alpha)
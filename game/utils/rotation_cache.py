@@ -0,0 +1,80 @@
+import threading
+from typing import List, Optional
+
+import pygame
+
+
+class RotationCache:
+    """Copies of a sprite rotated in ``steps`` even angle steps.
+
+    ``get(angle)`` serves the copy nearest to ``angle``, rendering it on first
+    use. ``prerender()`` renders the rest on a background thread; each copy
+    is converted on the main thread when it is first served. The cache holds
+    one image at a time (the sprite at its current scale); handing
+    ``set_image`` a different surface drops the old copies. With ``smooth``
+    the copies come from ``rotozoom`` (antialiased) instead of ``rotate``.
+    """
+
+    def __init__(self, steps: int = 90, smooth: bool = False):
+        self.steps = steps
+        self.smooth = smooth
+        self._image: Optional[pygame.Surface] = None
+        self._frames: List[Optional[pygame.Surface]] = []  # ready to blit
+        self._rendered: List[Optional[pygame.Surface]] = []  # from prerender
+
+    def set_image(self, image: pygame.Surface):
+        if image is self._image:
+            return
+        self._image = image
+        # new lists, so a running prerender fills the old ones and stops
+        self._frames = [None] * self.steps
+        self._rendered = [None] * self.steps
+
+    def index(self, angle: float) -> int:
+        return round(angle % 360 * self.steps / 360) % self.steps
+
+    def get(self, angle: float) -> pygame.Surface:
+        index = self.index(angle)
+        if index == 0:
+            return self._image
+        frame = self._frames[index]
+        if frame is None:
+            # prerendered on the worker, or rendered now; converted here since
+            # convert_alpha touches the display and belongs on the main thread
+            frame = self._rendered[index] or self._render(self._image, index)
+            frame = self._frames[index] = self._to_display(frame)
+            self._rendered[index] = None
+        return frame
+
+    def _render(self, image: pygame.Surface, index: int) -> pygame.Surface:
+        angle = index * 360 / self.steps
+        if self.smooth:
+            return pygame.transform.rotozoom(image, angle, 1.0)
+        return pygame.transform.rotate(image, angle)
+
+    def _to_display(self, frame: pygame.Surface) -> pygame.Surface:
+        # rotozoom hands back a plain 32-bit surface
+        if self.smooth and pygame.display.get_init():
+            return frame.convert_alpha()
+        return frame
+
+    # --- background ---
+    def prerender(self):
+        """Render every missing angle of the current image on a daemon thread."""
+        image, frames, rendered = self._image, self._frames, self._rendered
+        if image is None:
+            return
+
+        def fill():
+            for index in range(1, self.steps):
+                if rendered is not self._rendered:
+                    return  # image changed, these copies are stale
+                if frames[index] is None and rendered[index] is None:
+                    rendered[index] = self._render(image, index)
+
+        threading.Thread(target=fill, name="rotation-cache", daemon=True).start()
+
+    def clear(self):
+        self._image = None
+        self._frames = []
+        self._rendered = []
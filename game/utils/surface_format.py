@@ -0,0 +1,55 @@
+import pygame
+
+
+class SurfaceKind:
+    """What a surface is used for, which decides its display format."""
+
+    OPAQUE = "opaque"  # no transparent pixels: plain convert()
+    ALPHA = "alpha"  # per-pixel alpha: convert_alpha()
+    STATIC = "static"  # never transformed again: RLE accelerated
+
+
+def has_transparency(surf: pygame.Surface) -> bool:
+    """True if any pixel of ``surf`` is not fully opaque."""
+    if surf.get_colorkey() is not None:
+        return True
+    if not surf.get_flags() & pygame.SRCALPHA:
+        return False
+    return pygame.surfarray.pixels_alpha(surf).min() < 255
+
+
+def to_display_format(surf: pygame.Surface, kind: str = None) -> pygame.Surface:
+    """Convert ``surf`` to the fastest display format for its ``kind``.
+
+    With no ``kind`` the surface is checked for transparency and gets
+    ``convert()`` or ``convert_alpha()``. Needs a display mode to be set.
+    """
+    if kind is None:
+        kind = SurfaceKind.ALPHA if has_transparency(surf) else SurfaceKind.OPAQUE
+
+    if kind == SurfaceKind.OPAQUE:
+        return surf.convert()
+
+    alpha = surf.get_alpha()
+    surf = surf.convert_alpha()
+    if kind == SurfaceKind.STATIC:
+        # RLE makes blits of mostly transparent sprites cheap, but every
+        # transform has to decode it again, so only for sprites kept as is
+        surf.set_alpha(255 if alpha is None else alpha, pygame.RLEACCEL)
+    return surf
+
+
+def display_format() -> tuple:
+    """Pixel format of the current display, to detect format changes."""
+    display = pygame.display.get_surface()
+    if display is None:
+        return ()
+    return display.get_bitsize(), display.get_masks()[:3]
+
+
+def is_display_format(surf: pygame.Surface) -> bool:
+    """True if blitting ``surf`` to the display needs no pixel conversion."""
+    fmt = display_format()
+    if not fmt:
+        return True
+    return (surf.get_bitsize(), surf.get_masks()[:3]) == fmt
@@ -1,6 +1,5 @@
 import pygame as pg
-import pygame.freetype as ft
-from game.utils import resource_path
+from game.utils import resource_path, mouse_pos
 
 
 class Button:
@@ -69,8 +68,14 @@ class Button:
         self.border_radius = border_radius
 
         # set initial rect
+        self.rect = None
+        self._layout_key = None  # inputs of the current rect
         self.update_rect()
 
+        # dirty-rect presentation: True until the current look is reported
+        self.changed = True
+        self._presented_rect = None
+
         # pre-render text surfaces
         self.render_text()
 
@@ -126,6 +131,18 @@ class Button:
             text_rect = text_surface.get_rect(center=inner_rect.center)
             surface.blit(text_surface, text_rect)
 
+    def dirty_rect(self):
+        """Screen area to present if the button changed since the last call."""
+        if not self.changed:
+            return None
+        self.changed = False
+
+        # pressed buttons are drawn press_depth lower
+        area = self.rect.union(self.rect.move(0, self.press_depth))
+        dirty = area.union(self._presented_rect) if self._presented_rect else area
+        self._presented_rect = area
+        return dirty
+
     def update_rect(self, screen_size=None):
         """Update button rect based on screen size and ratios."""
         if not self.dynamic:
@@ -133,21 +150,30 @@ class Button:
         if screen_size:
             self.screen_size = screen_size
 
+        # only rebuild when the screen or the ratios changed
+        layout_key = (tuple(self.screen_size), self.size_ratio, self.pos_ratio)
+        if layout_key == self._layout_key:
+            return
+        self._layout_key = layout_key
+
         sw, sh = self.screen_size
         bw = int(sw * self.size_ratio[0])
         bh = int(sh * self.size_ratio[1])
         cx = int(sw * self.pos_ratio[0])
         cy = int(sh * self.pos_ratio[1])
-        self.rect = pg.Rect(0, 0, bw, bh)
-        self.rect.center = (cx, cy)
+        rect = pg.Rect(0, 0, bw, bh)
+        rect.center = (cx, cy)
+        if self.rect is None or rect != self.rect:
+            self.rect = rect
+            self.changed = True
 
     def render_text(self):
         """Pre-render text surfaces (supports freetype and pygame font)."""
         if not self.text:
             return
 
-        if isinstance(self.font, ft.Font):
-            # FreeType Font - needs size parameter
+        if not isinstance(self.font, pg.font.Font):
+            # FreeType Font or TextCache - needs size parameter
             size = self.font_size or 28  # Use provided size or default
 
             surf = self.font.render(self.text, self.font_color, size=size)
@@ -180,6 +206,7 @@ class Button:
     def on_click(self, event):
         if self.rect.collidepoint(event.pos):
             self.clicked = True
+            self.changed = True
             if self.click_sound:
                 self.click_sound.play()
             if not self.call_on_release:
@@ -190,10 +217,14 @@ class Button:
             self.function()
             if self.click_sound:
                 self.click_sound.play()
+        if self.clicked:
+            self.changed = True
         self.clicked = False
 
     def check_hover(self):
-        hovered_now = self.rect.collidepoint(pg.mouse.get_pos())
+        hovered_now = self.rect.collidepoint(mouse_pos())
         if hovered_now and not self.hovered and self.hover_sound:
             self.hover_sound.play()
+        if hovered_now != self.hovered:
+            self.changed = True
         self.hovered = hovered_now
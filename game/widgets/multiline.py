@@ -9,15 +9,28 @@ class MultiLine:
         start_y_ratio: float,
         line_spacing_ratio: float,
         game_size: tuple,
+        layout=None,
+        max_width_ratio: float = None,
     ):
         self.lines = lines
         self.start_y_ratio = start_y_ratio
         self.line_spacing_ratio = line_spacing_ratio
         self.game_size = game_size
+        self._laid_out_size = None
+
+        # lines without their own wrap settings wrap with the block's
+        if layout and max_width_ratio:
+            for line in self.lines:
+                if line.layout is None:
+                    line.layout = layout
+                    line.max_width_ratio = max_width_ratio
 
         self.update(game_size)
 
     def update(self, game_size: tuple):
+        if tuple(game_size) == self._laid_out_size:
+            return
+        self._laid_out_size = tuple(game_size)
         self.game_size = game_size
 
         start_y = int(self.game_size[1] * self.start_y_ratio)
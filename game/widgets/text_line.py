@@ -13,6 +13,8 @@ class TextLine:
         x_ratio=0.5,
         y_ratio=None,
         center_x=True,
+        layout=None,
+        max_width_ratio=None,
     ):
         self.text = text
         self.font = font
@@ -24,20 +26,35 @@ class TextLine:
         self.y_ratio = y_ratio
         self.center_x = center_x
 
+        # wrap to max_width_ratio of the screen width with a TextLayout
+        self.layout = layout
+        self.max_width_ratio = max_width_ratio
+
         self.surf = None
         self.rect = None
         self.pos = (0, 0)
+        self._layout_key = None  # inputs of the current surf/pos
 
         self.update(game_size)
 
     # update size & position
     def update(self, game_size: tuple, y_override=None):
+        # nothing to re-render unless the size or the text changed
+        layout_key = (tuple(game_size), y_override, self.text, self.color)
+        if layout_key == self._layout_key:
+            return
+        self._layout_key = layout_key
         self.game_size = game_size
 
         # dynamic font size
         font_size = int(self.game_size[1] / self.base_ratio)
-        self.font.size = font_size
-        self.surf, _ = self.font.render(self.text, self.color)
+        if self.layout and self.max_width_ratio:
+            max_width = int(self.game_size[0] * self.max_width_ratio)
+            self.surf, _ = self.layout.block(
+                self.text, self.color, max_width, size=font_size
+            )
+        else:
+            self.surf, _ = self.font.render(self.text, self.color, size=font_size)
         self.rect = self.surf.get_rect()
 
         # --- padding ---
@@ -24,6 +24,7 @@ from game.states import (
     Credits,
 )
 import logging
+import multiprocessing
 from winmode import WindowStates
 
 
@@ -68,4 +69,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # needed by the GIF decode process pool in the frozen .exe
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,76 @@
+"""Per-state frame time of the surface and SDL2 renderer presentation paths.
+
+Run from the project root:
+
+    python -m tests.bench_backends [--frames N] [--accelerated]
+
+Every state runs update + draw + present for N frames, first presented with
+display flips, then through ``RendererBackend`` (software unless
+``--accelerated``). The renderer opens its own window, so the surface runs
+go first while the display window is still the visible one.
+"""
+
+import argparse
+import time
+
+from game.core import BaseGame, RendererBackend
+from game.states import (
+    AstroLink,
+    Credits,
+    LaunchTower,
+    LifeSupport,
+    Menu,
+    SpaceQuiz,
+)
+
+
+def run_state(game, state, frames: int) -> float:
+    """Mean ms per frame of ``state``."""
+    first = game.state is None
+    game.sm.set_state(state.name)
+    if first:
+        # no transition into the first state, BaseGame.run starts it by hand
+        state.startup()
+    assert state.assets_loaded, f"{state.name.value} has no assets loaded"
+    game.update_layout_epoch()
+    dt = 1 / game.fps
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        state.update(game.screen, dt)
+        state.draw(game.screen)
+        game.present()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--accelerated", action="store_true")
+    args = parser.parse_args()
+
+    game = BaseGame()
+    states = [
+        cls(game)
+        for cls in (Menu, SpaceQuiz, LaunchTower, AstroLink, LifeSupport, Credits)
+    ]
+    for state in states:
+        game.add_state(state)
+
+    results = {}
+    game.renderer_backend = None
+    for state in states:
+        results[state.name] = [run_state(game, state, args.frames)]
+
+    game.renderer_backend = RendererBackend(software=not args.accelerated)
+    for state in states:
+        results[state.name].append(run_state(game, state, args.frames))
+
+    print(f"{game.size}, {args.frames} frames per state")
+    print(f"{'state':<16} {'surface ms':>11} {'renderer ms':>12}")
+    for name, (surface_ms, renderer_ms) in results.items():
+        print(f"{name.value:<16} {surface_ms:>11.2f} {renderer_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""LaunchTower.update microbenchmark with idle rockets.
+
+Run from the project root:
+
+    python -m tests.bench_launch_tower [--frames N] [--rescale-every-frame]
+
+``--rescale-every-frame`` drops the rockets' scaled images before every
+update, which is what idle rockets used to cost.
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from game.core import BaseGame
+from game.states import LaunchTower, States
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--rescale-every-frame", action="store_true")
+    args = parser.parse_args()
+
+    game = BaseGame()
+    tower = LaunchTower(game)
+    game.add_state(tower)
+    game.sm.set_state(States.LAUNCH_TOWER)
+    # no transition into the first state, BaseGame.run starts it by hand
+    tower.startup()
+    assert len(tower.rockets_list) == 3, "LaunchTower assets did not load"
+    screen = game.screen
+
+    times = []
+    for _ in range(args.frames):
+        if args.rescale_every_frame:
+            for rocket in tower.rockets_list:
+                rocket._scaled.clear()
+        start = time.perf_counter()
+        tower.update(screen, 1 / 60)
+        times.append(time.perf_counter() - start)
+
+    times.sort()
+    mean = sum(times) / len(times)
+    print(
+        f"{len(tower.rockets_list)} rockets at {game.size}, {args.frames} frames"
+        f"{' (rescaling every frame)' if args.rescale_every_frame else ''}"
+    )
+    print(
+        f"update: mean {mean * 1000:.3f} ms, "
+        f"p50 {times[len(times) // 2] * 1000:.3f} ms, "
+        f"p95 {times[int(len(times) * 0.95)] * 1000:.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Particle benchmark: update and draw time per frame for growing counts.
+
+Run from the project root:
+
+    python -m tests.bench_particles [--frames N] [--max-count N]
+
+Uses the 'celebration' preset, re-emitting so the count stays constant.
+"""
+
+import argparse
+import time
+
+import pygame
+
+from game.entities import PRESETS, ParticleSystem
+
+SCREEN_SIZE = (1280, 720)
+
+
+def run(count: int, frames: int):
+    """Return ``(update_ms, draw_ms)`` per frame for ``count`` particles."""
+    screen = pygame.Surface(SCREEN_SIZE).convert()
+    particles = ParticleSystem()
+    burst = PRESETS["celebration"]
+    x, y = SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2
+
+    update_s = draw_s = 0.0
+    for _ in range(frames):
+        particles.emit(x, y, burst, count=count - len(particles))
+
+        start = time.perf_counter()
+        particles.update(1 / 60)
+        updated = time.perf_counter()
+        screen.fill((0, 0, 0))
+        particles.draw(screen)
+        drawn = time.perf_counter()
+
+        update_s += updated - start
+        draw_s += drawn - updated
+
+    return update_s * 1000 / frames, draw_s * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--max-count", type=int, default=16000)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)  # convert() needs a display
+    print(f"{'count':>7} {'update ms':>10} {'draw ms':>8} {'frame ms':>9}")
+
+    count = 250
+    while count <= args.max_count:
+        update_ms, draw_ms = run(count, args.frames)
+        print(
+            f"{count:>7} {update_ms:>10.2f} {draw_ms:>8.2f}"
+            f" {update_ms + draw_ms:>9.2f}"
+        )
+        count *= 2
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
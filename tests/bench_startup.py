@@ -0,0 +1,83 @@
+"""Startup decode benchmark: wall time of decoding every GIF per worker count.
+
+Run from the project root:
+
+    python -m tests.bench_startup [--processes] [--repeat N]
+
+The GIF cache is bypassed so every run pays the full PIL decode.
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+import pygame
+
+from game.utils import frames_from_raw, read_gif_raw, resource_path
+
+SETTINGS_PATH = "data/settings.json"
+
+
+def gif_paths():
+    with open(SETTINGS_PATH) as f:
+        settings = json.load(f)
+    return [
+        resource_path(path)
+        for key, path in settings.items()
+        if key.endswith("_path") and path.lower().endswith(".gif")
+    ]
+
+
+def run_once(paths, workers: int, processes: bool):
+    """Return ``(decode_seconds, build_seconds)`` for one startup."""
+    pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    decode = partial(read_gif_raw, cache_dir=None)
+
+    start = time.perf_counter()
+    with pool(max_workers=workers) as executor:
+        raws = list(executor.map(decode, paths))
+    decoded = time.perf_counter()
+
+    # main thread part: building display format surfaces
+    for size, frames, _, has_alpha in raws:
+        frames_from_raw(size, frames, has_alpha)
+    built = time.perf_counter()
+
+    return decoded - start, built - decoded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)  # convert() needs a display
+    paths = gif_paths()
+    print(f"{len(paths)} GIFs, {'processes' if args.processes else 'threads'}")
+    print(f"{'workers':>7} {'decode ms':>10} {'build ms':>9} {'speedup':>8}")
+
+    baseline = None
+    workers = 1
+    while workers <= args.max_workers:
+        # best of N to hide disk cache warm-up
+        decode_s, build_s = min(
+            run_once(paths, workers, args.processes) for _ in range(args.repeat)
+        )
+        baseline = baseline or decode_s
+        print(
+            f"{workers:>7} {decode_s * 1000:>10.1f} {build_s * 1000:>9.1f}"
+            f" {baseline / decode_s:>7.2f}x"
+        )
+        workers *= 2
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()